@@ -16,6 +16,9 @@ logger = logging.getLogger('julie_julie')
 class OllamaManager:
     """Manages the Ollama service lifecycle."""
     
+    # Seconds a successful /api/tags response is reused across status checks
+    TAGS_TTL = 3.0
+    
     def __init__(self):
         self.ollama_process = None
         self.is_running = False
@@ -23,35 +26,49 @@ class OllamaManager:
         self.model_name = "llama3.2"  # Default to a more commonly available model
         self.ollama_url = "http://localhost:11434"
         self.startup_timeout = 30  # seconds
+        self._tags_cache = (0.0, None)  # (monotonic time, /api/tags data)
+        self._session = requests.Session()  # keep-alive for repeated status probes
         
-    def check_ollama_running(self) -> bool:
-        """Check if Ollama is running and responsive."""
-        try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
-            self.is_running = response.status_code == 200
-            return self.is_running
-        except Exception:
-            self.is_running = False
-            return False
-    
-    def check_model_available(self) -> bool:
-        """Check if the required model is available."""
+    def _get_tags(self) -> Optional[Dict[str, Any]]:
+        """
+        Fetch /api/tags, reusing a successful response for TAGS_TTL seconds.
+        Failures are not cached so a starting service is noticed right away.
+        """
+        cached_at, data = self._tags_cache
+        if data is not None and time.monotonic() - cached_at < self.TAGS_TTL:
+            return data
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.ollama_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 data = response.json()
-                models = [model['name'] for model in data.get('models', [])]
-                return any(self.model_name in model for model in models)
+                self._tags_cache = (time.monotonic(), data)
+                return data
         except Exception:
             pass
+        return None
+    
+    def _clear_tags_cache(self):
+        """Forget the cached /api/tags response after the service or models change."""
+        self._tags_cache = (0.0, None)
+    
+    def check_ollama_running(self) -> bool:
+        """Check if Ollama is running and responsive."""
+        self.is_running = self._get_tags() is not None
+        return self.is_running
+    
+    def check_model_available(self) -> bool:
+        """Check if the required model is available."""
+        data = self._get_tags()
+        if data is not None:
+            models = [model['name'] for model in data.get('models', [])]
+            return any(self.model_name in model for model in models)
         return False
     
     def list_available_models(self) -> list:
         """Get list of all downloaded models."""
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
+            data = self._get_tags()
+            if data is not None:
                 models = []
                 for model in data.get('models', []):
                     name = model['name']
@@ -158,6 +175,7 @@ class OllamaManager:
             
             if result.returncode == 0:
                 logger.info(f"Model {self.model_name} pulled successfully")
+                self._clear_tags_cache()
                 return True
             else:
                 logger.error(f"Failed to pull model {self.model_name}: {result.stderr}")
@@ -186,6 +204,7 @@ class OllamaManager:
             finally:
                 self.ollama_process = None
                 self.is_running = False
+                self._clear_tags_cache()
     
     def ensure_ollama_available(self) -> bool:
         """Ensure Ollama is running and the model is available."""
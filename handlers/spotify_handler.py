@@ -9,9 +9,13 @@ import subprocess
 import json
 import os
 from datetime import datetime
+from urllib.parse import quote
 
 logger = logging.getLogger('julie_julie')
 
+# Spotify web player search URL
+SPOTIFY_SEARCH_URL = "https://open.spotify.com/search/{}"
+
 # File to store remembered Spotify tracks
 FAVORITES_FILE = os.path.expanduser("~/Library/Application Support/JulieJulie/spotify_favorites.json")
 
@@ -79,8 +83,7 @@ def _handle_spotify_play(original_command, command_lower):
     
     try:
         # Use Spotify web player (always works, no app required)
-        search_formatted = search_query.replace(' ', '%20')
-        spotify_web_url = f"https://open.spotify.com/search/{search_formatted}"
+        spotify_web_url = SPOTIFY_SEARCH_URL.format(quote(search_query, safe=''))
         
         # Open in browser
         webbrowser.open(spotify_web_url)
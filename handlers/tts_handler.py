@@ -9,6 +9,7 @@ import os
 import json
 from typing import Optional, Dict, Any
 import tempfile
+from contextlib import contextmanager
 from handlers.voice_control_manager import managed_speech
 
 logger = logging.getLogger('julie_julie')
@@ -41,7 +42,7 @@ class TTSManager:
             
             return False
         except Exception as e:
-            logger.debug(f"Error checking Google credentials: {e}")
+            logger.debug("Error checking Google credentials: %s", e)
             return False
     
     def _google_tts(self, text: str, voice: str = "en-US-Standard-A") -> bool:
@@ -144,6 +145,54 @@ class TTSManager:
         
         return {"success": False, "error": "Both TTS methods failed", "method": "none"}
     
+    @contextmanager
+    def speech_stream(self, voice: str = "Alex"):
+        """
+        Yield a function that speaks sentences through one long-lived say process.
+        
+        Each sentence is written as a line to say's stdin, so a multi-sentence
+        response pays for one process spawn and voice load instead of one per
+        sentence. When Google TTS is in use (or say cannot start), sentences
+        go through speak() one at a time.
+        """
+        if self.use_google_tts and self.google_available:
+            yield self.speak
+            return
+        
+        with managed_speech():
+            try:
+                say_proc = subprocess.Popen(
+                    ['say', '-v', voice],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1
+                )
+            except OSError as e:
+                logger.error(f"Could not start say stream: {e}")
+                say_proc = None
+            
+            if say_proc is None:
+                yield self.speak
+                return
+            
+            def say_line(text: str):
+                try:
+                    say_proc.stdin.write(text.replace('\n', ' ') + '\n')
+                    say_proc.stdin.flush()
+                except (BrokenPipeError, ValueError) as e:
+                    logger.error(f"Say stream closed: {e}")
+            
+            try:
+                yield say_line
+            finally:
+                try:
+                    say_proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+                say_proc.wait()
+    
     def set_google_preference(self, use_google: bool):
         """Enable or disable Google TTS preference."""
         self.use_google_tts = use_google
@@ -164,6 +213,10 @@ def speak_text(text: str, force_fallback: bool = False) -> Dict[str, Any]:
     """Convenience function to speak text."""
     return tts_manager.speak(text, force_fallback)
 
+def speech_stream():
+    """Context manager yielding a sentence-speaking function backed by one say process."""
+    return tts_manager.speech_stream()
+
 def set_tts_preference(use_google: bool):
     """Set TTS preference."""
     tts_manager.set_google_preference(use_google)
@@ -40,7 +40,7 @@ class VoiceControlManager:
             return result.returncode == 0 and result.stdout.strip() == "true"
             
         except Exception as e:
-            logger.debug(f"Error checking Voice Control availability: {e}")
+            logger.debug("Error checking Voice Control availability: %s", e)
             return False
     
     def stop_listening(self) -> bool:
@@ -64,11 +64,11 @@ class VoiceControlManager:
                 logger.debug("Voice Control listening stopped")
                 return True
             else:
-                logger.debug(f"Failed to stop Voice Control: {result.stderr}")
+                logger.debug("Failed to stop Voice Control: %s", result.stderr)
                 return False
                 
         except Exception as e:
-            logger.debug(f"Error stopping Voice Control: {e}")
+            logger.debug("Error stopping Voice Control: %s", e)
             return False
     
     def start_listening(self) -> bool:
@@ -92,11 +92,11 @@ class VoiceControlManager:
                 logger.debug("Voice Control listening started")
                 return True
             else:
-                logger.debug(f"Failed to start Voice Control: {result.stderr}")
+                logger.debug("Failed to start Voice Control: %s", result.stderr)
                 return False
                 
         except Exception as e:
-            logger.debug(f"Error starting Voice Control: {e}")
+            logger.debug("Error starting Voice Control: %s", e)
             return False
     
     def get_listening_status(self) -> Optional[bool]:
@@ -133,7 +133,7 @@ class VoiceControlManager:
                 return None
                 
         except Exception as e:
-            logger.debug(f"Error checking Voice Control status: {e}")
+            logger.debug("Error checking Voice Control status: %s", e)
             return None
     
     @contextmanager
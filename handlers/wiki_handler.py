@@ -1,8 +1,16 @@
 import requests
 import logging
+from urllib.parse import quote
 
 logger = logging.getLogger('julie_julie')
 
+WIKI_SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/{}"
+WIKI_PAGE_URL = "https://en.wikipedia.org/wiki/{}"
+
+def _wiki_title(topic):
+    """Encode a topic as a Wikipedia page title path segment."""
+    return quote(topic.strip().replace(' ', '_'), safe='')
+
 def handle_wiki_command(topic, ollama_url="http://localhost:11434/api/generate"):
     """Handle information queries via Wikipedia with Ollama query reformatting."""
     try:
@@ -31,7 +39,8 @@ def handle_wiki_command(topic, ollama_url="http://localhost:11434/api/generate")
         
         # Now fetch from Wikipedia
         logger.info(f"Fetching Wikipedia info for: {wiki_topic}")
-        wiki_api_url = "https://en.wikipedia.org/api/rest_v1/page/summary/" + wiki_topic.replace(' ', '_')
+        wiki_title = _wiki_title(wiki_topic)
+        wiki_api_url = WIKI_SUMMARY_URL.format(wiki_title)
         
         response = requests.get(wiki_api_url, timeout=10)
         
@@ -47,18 +56,18 @@ def handle_wiki_command(topic, ollama_url="http://localhost:11434/api/generate")
                 
                 return {
                     "spoken_response": summary,
-                    "opened_url": data.get('content_urls', {}).get('desktop', {}).get('page', f"https://en.wikipedia.org/wiki/{wiki_topic.replace(' ', '_')}"),
+                    "opened_url": data.get('content_urls', {}).get('desktop', {}).get('page', WIKI_PAGE_URL.format(wiki_title)),
                     "additional_context": "I've also opened the full Wikipedia page for more details."
                 }
             else:
-                wiki_url = f"https://en.wikipedia.org/wiki/{wiki_topic.replace(' ', '_')}"
+                wiki_url = WIKI_PAGE_URL.format(wiki_title)
                 return {
                     "spoken_response": f"I couldn't find a summary for {wiki_topic}, but I've opened the Wikipedia page.",
                     "opened_url": wiki_url,
                     "additional_context": None
                 }
         else:
-            wiki_url = f"https://en.wikipedia.org/wiki/{wiki_topic.replace(' ', '_')}"
+            wiki_url = WIKI_PAGE_URL.format(wiki_title)
             return {
                 "spoken_response": f"I couldn't retrieve information about {wiki_topic} right now, but I've opened the Wikipedia page.",
                 "opened_url": wiki_url,
@@ -67,7 +76,7 @@ def handle_wiki_command(topic, ollama_url="http://localhost:11434/api/generate")
     
     except Exception as e:
         logger.error(f"Wikipedia error: {e}")
-        wiki_url = f"https://en.wikipedia.org/wiki/{topic.replace(' ', '_')}"
+        wiki_url = WIKI_PAGE_URL.format(_wiki_title(topic))
         return {
             "spoken_response": f"I had trouble getting information about {topic}, but I've opened the Wikipedia page.",
             "opened_url": wiki_url,
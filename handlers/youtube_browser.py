@@ -9,9 +9,13 @@ import webbrowser
 import json
 import os
 from datetime import datetime
+from urllib.parse import quote_plus
 
 logger = logging.getLogger('julie_julie')
 
+# YouTube search results URL
+YOUTUBE_SEARCH_URL = "https://www.youtube.com/results?search_query={}"
+
 # File to store remembered videos
 FAVORITES_FILE = os.path.expanduser("~/Library/Application Support/JulieJulie/favorites.json")
 
@@ -86,10 +90,9 @@ def _handle_youtube_browser_play(original_command, command_lower):
     
     # Add "official music video" to prioritize official versions and music videos
     enhanced_search = f"{search_query} official music video"
-    search_formatted = enhanced_search.replace(' ', '+')
     
     # Create YouTube search URL
-    youtube_url = f"https://www.youtube.com/results?search_query={search_formatted}"
+    youtube_url = YOUTUBE_SEARCH_URL.format(quote_plus(enhanced_search))
     
     logger.info(f"Opening YouTube for: {search_query}")
     
@@ -11,9 +11,14 @@ import os
 import subprocess
 import time
 from datetime import datetime
+from urllib.parse import quote_plus
 
 logger = logging.getLogger('julie_julie')
 
+# YouTube Music and YouTube search URLs
+YOUTUBE_MUSIC_SEARCH_URL = "https://music.youtube.com/search?q={}"
+YOUTUBE_SEARCH_URL = "https://www.youtube.com/results?search_query={}"
+
 # File to store remembered videos
 FAVORITES_FILE = os.path.expanduser("~/Library/Application Support/JulieJulie/favorites.json")
 
@@ -86,18 +91,14 @@ def _handle_youtube_play(original_command, command_lower):
             "additional_context": None
         }
     
-    # Use YouTube's "watch" URL with search query
-    # This often goes directly to a relevant video
-    search_formatted = search_query.replace(' ', '+')
-    
     # Add "official" to the search to prioritize official versions
-    enhanced_search = f"{search_query} official".replace(' ', '+')
+    enhanced_search = quote_plus(f"{search_query} official")
     
     # Try YouTube Music first (more likely to autoplay)
-    youtube_music_url = f"https://music.youtube.com/search?q={enhanced_search}"
+    youtube_music_url = YOUTUBE_MUSIC_SEARCH_URL.format(enhanced_search)
     
     # Fallback to regular YouTube with official preference
-    youtube_url = f"https://www.youtube.com/results?search_query={enhanced_search}"
+    youtube_url = YOUTUBE_SEARCH_URL.format(enhanced_search)
     
     # Choose YouTube Music for better autoplay chances
     final_url = youtube_music_url
@@ -1,26 +1,57 @@
 import rumps
 import threading
 import logging
+import contextlib
+import functools
+import queue
+import re
+import time
 import os
 import sys
-import json
-from flask import Flask, request, jsonify
+from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
 import subprocess
-from datetime import datetime
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
+import importlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
 
 # Import handlers
-from handlers.calculation_handler import handle_calculation
-from handlers.youtube_browser import handle_youtube_command
-from handlers.apple_music_handler import handle_apple_music_command
-from handlers.spotify_handler import handle_spotify_command
-from handlers.visualizer_handler import handle_visualizer_command
-from handlers.radio_handler import handle_radio_command
-from handlers.audio_handler import handle_audio_command
-from handlers.tts_handler import speak_text, handle_tts_command
+from handlers.tts_handler import speak_text, speech_stream, handle_tts_command
 from handlers.ollama_manager import ensure_ollama_available, handle_ollama_command, cleanup_ollama, ollama_manager
 from handlers.voice_control_manager import handle_voice_control_command, restart_voice_control_after_response
 from utils.logging_utils import setup_colored_logging, print_startup_banner
+from utils import json_utils
+
+def _lazy_handler(module_name, attr):
+    """Return a command handler whose module is only imported on first use."""
+    @functools.lru_cache(maxsize=None)
+    def load():
+        return getattr(importlib.import_module(module_name), attr)
+    
+    def handler(text_command):
+        return load()(text_command)
+    
+    handler.__name__ = attr
+    return handler
+
+# Feature handlers load on demand to keep menubar startup light; speech,
+# Ollama and Voice Control are needed for every query and stay eager
+handle_calculation = _lazy_handler('handlers.calculation_handler', 'handle_calculation')
+handle_youtube_command = _lazy_handler('handlers.youtube_browser', 'handle_youtube_command')
+handle_apple_music_command = _lazy_handler('handlers.apple_music_handler', 'handle_apple_music_command')
+handle_spotify_command = _lazy_handler('handlers.spotify_handler', 'handle_spotify_command')
+handle_visualizer_command = _lazy_handler('handlers.visualizer_handler', 'handle_visualizer_command')
+handle_radio_command = _lazy_handler('handlers.radio_handler', 'handle_radio_command')
+handle_audio_command = _lazy_handler('handlers.audio_handler', 'handle_audio_command')
 
 # --- Configuration ---
 APP_NAME = "Julie Julie"
@@ -28,6 +59,23 @@ APP_VERSION = "0.4.0"
 APP_ICON = None
 FLASK_PORT = 58586
 LOG_FILE = os.path.expanduser("~/Library/Logs/JulieJulie/julie_julie.log")
+TIME_FORMAT = "%I:%M %p"
+GEOCODE_URL = "https://nominatim.openstreetmap.org/search?q={}&format=json&limit=1&countrycodes=us"
+NWS_POINTS_URL = "https://api.weather.gov/points/{},{}"
+DEFAULT_LOCATION = "Kansas City, Missouri"
+# (connect, read) timeouts for Ollama; the read timeout applies between chunks,
+# so long generations are not cut off
+OLLAMA_TIMEOUT = (3.05, 60)
+# Plain time questions ("what time is it", "what's the time") that the menu
+# can answer without going through the full dispatcher
+_TIME_RE = re.compile(
+    r"^\s*(?:what(?:'s|\s+is)?\s+)?(?:the\s+)?(?:current\s+)?(?:time|clock)(?:\s+is\s+it)?\s*\??\s*$",
+    re.IGNORECASE
+)
+# Sentence terminators used to split streamed Ollama replies for speech
+_SENT_END = re.compile(r'[.!?]')
+# Location in "weather in <place>" / "weather for <place>" requests
+_LOC_RE = re.compile(r'\bweather\b.*?\b(?:in|for)\s+(.+?)\s*\??\s*$', re.IGNORECASE)
 
 # --- Setup Logging ---
 def setup_logging():
@@ -40,277 +88,415 @@ def setup_logging():
     print_startup_banner(APP_NAME, APP_VERSION)
     return logger
 
-# Global state for tracking if Julie Julie is currently speaking
-is_speaking = False
-is_processing = False
+# Activity state as bit flags in one int, so readers always see a consistent pair.
+# Several commands can run at once on the worker pool, so each flag counts its
+# active holders and stays set until the last one finishes.
+_STATE_IDLE, _STATE_PROCESSING, _STATE_SPEAKING = 0, 1, 2
+_state = _STATE_IDLE
+_state_counts = {_STATE_PROCESSING: 0, _STATE_SPEAKING: 0}
+_state_lock = threading.Lock()
+
+def _set_state(flag, active):
+    """Enter (active=True) or leave one activity; its flag is set while any holder is active."""
+    global _state
+    with _state_lock:
+        _state_counts[flag] += 1 if active else -1
+        _state = (_state | flag) if _state_counts[flag] else (_state & ~flag)
+
+# Held while anything is being said, so queued replies and streamed Ollama
+# replies take turns instead of talking over each other
+_speech_turn = threading.Lock()
+
+@contextlib.contextmanager
+def _speaking():
+    """Take the speech turn and report the assistant as speaking until done."""
+    with _speech_turn:
+        _set_state(_STATE_SPEAKING, True)
+        try:
+            yield
+        finally:
+            _set_state(_STATE_SPEAKING, False)
 
 logger = setup_logging()
 
-# --- Simple Handlers ---
-def handle_time_command():
-    now = datetime.now()
+# --- HTTP ---
+# Shared session for the weather APIs so connections are kept alive between
+# requests, with a couple of quick retries for transient gateway errors
+HTTP = requests.Session()
+HTTP.headers.update({'User-Agent': 'Julie-Julie-Voice-Assistant'})
+_weather_adapter = HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=2,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET"])
+    )
+)
+HTTP.mount("https://nominatim.openstreetmap.org", _weather_adapter)
+HTTP.mount("https://api.weather.gov", _weather_adapter)
+
+# Separate session for the local Ollama server so streaming sockets stay apart
+OLLAMA = requests.Session()
+
+def _result(spoken_response, opened_url=None, additional_context=None):
+    """Build the standard handler response dict in one place."""
     return {
-        "spoken_response": f"The current time is {now.strftime('%I:%M %p')}.",
-        "opened_url": None,
-        "additional_context": None
+        "spoken_response": spoken_response,
+        "opened_url": opened_url,
+        "additional_context": additional_context
     }
 
+# --- Simple Handlers ---
+# (epoch minute, spoken text); the reply only changes once a minute
+_time_cache = (-1, None)
+
+def handle_time_command():
+    global _time_cache
+    minute = int(time.time() // 60)
+    if _time_cache[0] != minute:
+        _time_cache = (minute, f"The current time is {time.strftime(TIME_FORMAT)}.")
+    return _result(_time_cache[1])
+
+@functools.lru_cache(maxsize=256)
+def _geocode(location):
+    """Return (lat, lon, display_name) for a normalized location, or None if not found."""
+    geo_response = HTTP.get(GEOCODE_URL.format(quote_plus(location)), timeout=10)
+    # Raise rather than return so failed lookups are not cached
+    geo_response.raise_for_status()
+    geo_data = json_utils.loads(geo_response.content)
+    if not geo_data:
+        return None
+    return float(geo_data[0]['lat']), float(geo_data[0]['lon']), geo_data[0]['display_name']
+
+@functools.lru_cache(maxsize=256)
+def _forecast_url(lat, lon):
+    """Return the NWS forecast URL for a point; stable per grid location."""
+    nws_response = HTTP.get(NWS_POINTS_URL.format(lat, lon), timeout=10)
+    nws_response.raise_for_status()
+    return json_utils.loads(nws_response.content)['properties']['forecast']
+
+def _warm_connections():
+    """Open pooled connections (DNS, TCP, TLS) to the services we call before they are needed."""
+    targets = [
+        (HTTP, "https://nominatim.openstreetmap.org/"),
+        (HTTP, "https://api.weather.gov/"),
+        (OLLAMA, f"{ollama_manager.ollama_url}/api/tags"),
+    ]
+    for client, url in targets:
+        try:
+            client.head(url, timeout=5)
+        except Exception as e:
+            logger.debug("Connection warmup failed for %s: %s", url, e)
+
+def _warm_weather_cache(location):
+    """Prime the geocode and forecast-URL caches so the first query skips those lookups."""
+    try:
+        coordinates = _geocode(location.strip().lower())
+        if coordinates:
+            _forecast_url(coordinates[0], coordinates[1])
+            logger.info("Weather cache warmed for: %s", location)
+    except Exception as e:
+        logger.warning("Could not warm weather cache for %s: %s", location, e)
+
 def handle_weather_command(location=None):
     try:
         if not location:
-            location = "Kansas City, Missouri"  # Default location
+            location = DEFAULT_LOCATION
         
-        logger.info(f"Fetching weather for: {location}")
+        logger.info("Fetching weather for: %s", location)
         
         # Use National Weather Service API (free, no API key needed, very reliable for US)
-        # First, we need to geocode the location to get coordinates
-        geocode_url = f"https://nominatim.openstreetmap.org/search?q={location}&format=json&limit=1&countrycodes=us"
-        
+        # First, we need to geocode the location to get coordinates (cached per location)
         try:
-            geo_response = requests.get(geocode_url, timeout=10, headers={'User-Agent': 'Julie-Julie-Voice-Assistant'})
-            if geo_response.status_code == 200:
-                geo_data = geo_response.json()
-                if geo_data:
-                    lat = float(geo_data[0]['lat'])
-                    lon = float(geo_data[0]['lon'])
-                    display_name = geo_data[0]['display_name']
-                    logger.info(f"Found coordinates for {location}: {lat}, {lon} ({display_name})")
+            coordinates = _geocode(location.strip().lower())
+            if coordinates:
+                lat, lon, display_name = coordinates
+                logger.info("Found coordinates for %s: %s, %s (%s)", location, lat, lon, display_name)
+                
+                # Now get weather from National Weather Service
+                forecast_url = _forecast_url(lat, lon)
+                
+                # Get the actual forecast
+                forecast_response = HTTP.get(forecast_url, timeout=10)
+                if forecast_response.status_code == 200:
+                    forecast_data = json_utils.loads(forecast_response.content)
+                    current_period = forecast_data['properties']['periods'][0]
                     
-                    # Now get weather from National Weather Service
-                    nws_url = f"https://api.weather.gov/points/{lat},{lon}"
-                    nws_response = requests.get(nws_url, timeout=10, headers={'User-Agent': 'Julie-Julie-Voice-Assistant'})
+                    temp = current_period['temperature']
+                    temp_unit = current_period['temperatureUnit']
+                    conditions = current_period['shortForecast']
+                    detailed = current_period['detailedForecast']
                     
-                    if nws_response.status_code == 200:
-                        nws_data = nws_response.json()
-                        forecast_url = nws_data['properties']['forecast']
-                        
-                        # Get the actual forecast
-                        forecast_response = requests.get(forecast_url, timeout=10, headers={'User-Agent': 'Julie-Julie-Voice-Assistant'})
-                        if forecast_response.status_code == 200:
-                            forecast_data = forecast_response.json()
-                            current_period = forecast_data['properties']['periods'][0]
-                            
-                            temp = current_period['temperature']
-                            temp_unit = current_period['temperatureUnit']
-                            conditions = current_period['shortForecast']
-                            detailed = current_period['detailedForecast']
-                            
-                            # Create a clean location name
-                            location_parts = display_name.split(',')
-                            clean_location = f"{location_parts[0]}, {location_parts[-2].strip()}"
-                            
-                            weather_response = f"The weather in {clean_location} is {conditions}, {temp} degrees {temp_unit}."
-                            logger.info(f"Weather response: {weather_response}")
-                            
-                            return {
-                                "spoken_response": weather_response,
-                                "opened_url": None,
-                                "additional_context": f"Full forecast: {detailed}"
-                            }
-                else:
-                    logger.warning(f"No geocoding results for: {location}")
+                    # Create a clean location name
+                    location_parts = display_name.split(',')
+                    clean_location = f"{location_parts[0]}, {location_parts[-2].strip()}"
+                    
+                    weather_response = f"The weather in {clean_location} is {conditions}, {temp} degrees {temp_unit}."
+                    logger.info("Weather response: %s", weather_response)
+                    
+                    return _result(weather_response, additional_context=f"Full forecast: {detailed}")
+            else:
+                logger.warning("No geocoding results for: %s", location)
         except Exception as e:
-            logger.error(f"NWS weather error: {e}")
+            logger.error("NWS weather error: %s", e)
         
-        return {
-            "spoken_response": f"I couldn't get the weather for {location} right now.",
-            "opened_url": None,
-            "additional_context": None
-        }
+        return _result(f"I couldn't get the weather for {location} right now.")
     
     except Exception as e:
-        logger.error(f"Weather error: {e}")
-        return {
-            "spoken_response": f"I'm having trouble getting the weather for {location}.",
-            "opened_url": None,
-            "additional_context": None
-        }
+        logger.error("Weather error: %s", e)
+        return _result(f"I'm having trouble getting the weather for {location}.")
+
+def _iter_lines(chunks):
+    """Yield the non-empty lines of a newline-delimited byte stream."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        newline = buffer.find(b'\n')
+        while newline >= 0:
+            line = bytes(buffer[start:newline])
+            start = newline + 1
+            if line.strip():
+                yield line
+            newline = buffer.find(b'\n', start)
+        del buffer[:start]
+    
+    # A final frame may arrive without a trailing newline
+    if buffer.strip():
+        yield bytes(buffer)
+
+_RESPONSE_FIELD = b'"response":"'
+_DONE_TRUE = b'"done":true'
+
+def _ollama_frame(line):
+    """
+    Return (token, done) for one Ollama stream frame, or None if it is not valid JSON.
+    Plain tokens in complete {...} frames are sliced straight out of the bytes;
+    escaped tokens and anything else fall back to a full decode.
+    """
+    line = line.strip()
+    start = line.find(_RESPONSE_FIELD)
+    if start >= 0 and line.startswith(b'{') and line.endswith(b'}'):
+        start += len(_RESPONSE_FIELD)
+        end = line.find(b'"', start)
+        if end >= 0 and b'\\' not in line[start:end]:
+            return line[start:end].decode('utf-8'), _DONE_TRUE in line
+    
+    try:
+        data = json_utils.loads(line)
+    except json_utils.JSONDecodeError:
+        return None
+    return data.get('response', ''), data.get('done', False)
+
+OLLAMA_PROMPT = (
+    "You are Julie Julie, a helpful voice assistant. Give very brief, direct answers - "
+    "usually just 1-2 sentences. Be conversational but concise. Question: "
+)
+OLLAMA_OPTIONS = {
+    "temperature": 0.7,
+    "max_tokens": 50  # Limit response length
+}
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+@functools.lru_cache(maxsize=8)
+def _ollama_body_prefix(model):
+    """Encode the request body up to the user's question, once per model."""
+    settings = json_utils.dumpb({"model": model, "stream": True, "options": OLLAMA_OPTIONS})
+    # Leave the prompt string open so the escaped question can be appended
+    return settings[:-1] + b',"prompt":' + json_utils.dumpb(OLLAMA_PROMPT)[:-1]
+
+def _ollama_body(model, user_query):
+    """Build the streaming /api/generate request body for a question."""
+    return _ollama_body_prefix(model) + json_utils.dumpb(user_query)[1:] + b'}'
 
 def handle_ollama_query(user_query):
     try:
-        logger.info(f"Sending streaming query to Ollama: {user_query}")
+        logger.info("Sending streaming query to Ollama: %s", user_query)
         
         # Ensure Ollama is available before attempting connection
         if not ensure_ollama_available():
-            return {
-                "spoken_response": "I'm having trouble starting the AI service. Please check if Ollama is installed.",
-                "opened_url": None,
-                "additional_context": "Ollama service unavailable"
-            }
+            return _result(
+                "I'm having trouble starting the AI service. Please check if Ollama is installed.",
+                additional_context="Ollama service unavailable"
+            )
         
         ollama_url = "http://localhost:11434/api/generate"
-        payload = {
-            "model": ollama_manager.model_name,  # Use current model
-            "prompt": f"You are Julie Julie, a helpful voice assistant. Give very brief, direct answers - usually just 1-2 sentences. Be conversational but concise. Question: {user_query}",
-            "stream": True,  # Enable streaming
-            "options": {
-                "temperature": 0.7,
-                "max_tokens": 50  # Limit response length
-            }
-        }
-        
-        response = requests.post(ollama_url, json=payload, timeout=30, stream=True)
+        body = _ollama_body(ollama_manager.model_name, user_query)  # Use current model
         
-        if response.status_code == 200:
-            full_response = ""
-            sentence_buffer = ""
-            
-            for line in response.iter_lines():
-                if line:
-                    try:
-                        data = json.loads(line.decode('utf-8'))
-                        token = data.get('response', '')
+        # Closing the response returns the connection to the session's pool
+        with OLLAMA.post(ollama_url, data=body, headers=_JSON_HEADERS,
+                         timeout=OLLAMA_TIMEOUT, stream=True) as response:
+            if response.status_code == 200:
+                # One say process for the whole reply instead of one per sentence,
+                # spoken in turn with the speech thread
+                with _speaking(), speech_stream() as say:
+                    full_response = ""
+                    sentence_buffer = ""
+                    
+                    # Read the socket through urllib3 directly; chunked replies
+                    # yield each token frame as soon as it arrives
+                    for line in _iter_lines(response.raw.stream(4096, decode_content=True)):
+                        frame = _ollama_frame(line)
+                        if frame is None:
+                            continue
+                        token, done = frame
                         
                         if token:
                             sentence_buffer += token
                             full_response += token
                             
-                            # Check if we have a complete sentence
-                            if any(punct in sentence_buffer for punct in ['.', '!', '?']):
-                                # Find the end of the sentence
-                                for punct in ['.', '!', '?']:
-                                    if punct in sentence_buffer:
-                                        sentence_end = sentence_buffer.find(punct) + 1
-                                        complete_sentence = sentence_buffer[:sentence_end].strip()
-                                        
-                                        if complete_sentence:
-                                            logger.info(f"Speaking sentence: {complete_sentence}")
-                                            # Speak the sentence immediately - suppress any stdout
-                                            result = speak_text(complete_sentence)
-                                        
-                                        # Keep remainder for next sentence
-                                        sentence_buffer = sentence_buffer[sentence_end:].strip()
-                                        break
+                            # Flush every complete sentence; earlier text was already
+                            # scanned, so only the new token can hold a terminator
+                            match = _SENT_END.search(sentence_buffer, len(sentence_buffer) - len(token))
+                            while match:
+                                sentence_end = match.end()
+                                complete_sentence = sentence_buffer[:sentence_end].strip()
+                                if complete_sentence:
+                                    logger.info("Speaking sentence: %s", complete_sentence)
+                                    say(complete_sentence)
+                                
+                                # Keep remainder for next sentence
+                                sentence_buffer = sentence_buffer[sentence_end:].lstrip()
+                                match = _SENT_END.search(sentence_buffer)
                         
                         # Check if generation is done
-                        if data.get('done', False):
+                        if done:
                             # Speak any remaining text
                             if sentence_buffer.strip():
-                                logger.info(f"Speaking final fragment: {sentence_buffer.strip()}")
-                                result = speak_text(sentence_buffer.strip())
+                                logger.info("Speaking final fragment: %s", sentence_buffer.strip())
+                                say(sentence_buffer.strip())
                             break
-                            
-                    except json.JSONDecodeError:
-                        continue
-            
-            return {
-                "spoken_response": full_response.strip(),
-                "opened_url": None,
-                "additional_context": "Response was streamed and spoken in real-time"
-            }
-        else:
-            return {
-                "spoken_response": "I'm having trouble thinking right now.",
-                "opened_url": None,
-                "additional_context": None
-            }
+                
+                return _result(full_response.strip(), additional_context="Response was streamed and spoken in real-time")
+            else:
+                return _result("I'm having trouble thinking right now.")
     
     except Exception as e:
-        logger.error(f"Ollama streaming error: {e}")
-        return {
-            "spoken_response": "Something went wrong while thinking about that.",
-            "opened_url": None,
-            "additional_context": None
-        }
+        logger.error("Ollama streaming error: %s", e)
+        return _result("Something went wrong while thinking about that.")
+
+# --- Speech ---
+# Responses are spoken by a single background thread so request threads
+# return as soon as the reply is built. It shares the speech turn with
+# streamed Ollama replies, so utterances never overlap.
+SPEECH_Q = queue.Queue()
+
+def _speaker():
+    while True:
+        # Utterances that piled up while the last one was spoken share one say
+        # call; nothing waits for more to arrive
+        parts = [SPEECH_Q.get()]
+        while True:
+            try:
+                parts.append(SPEECH_Q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            with _speaking():
+                speak_text(" ".join(parts))
+        except Exception as e:
+            logger.error("Speech error: %s", e)
+        finally:
+            for _ in parts:
+                SPEECH_Q.task_done()
+
+threading.Thread(target=_speaker, name="julie-speech", daemon=True).start()
+
+def speak(text):
+    """Queue text to be spoken without blocking the caller."""
+    if text:
+        SPEECH_Q.put(text)
 
 # --- Core Logic ---
 def speak_response(result):
     """Helper function to speak a response."""
-    global is_speaking
-    spoken_response = result.get("spoken_response")
-    if spoken_response:
-        is_speaking = True
-        speak_text(spoken_response)
-        is_speaking = False
+    speak(result.get("spoken_response"))
     return result
 
-def process_command_from_user(text_command):
-    global is_processing
+_WORD_RE = re.compile(r"[a-z]+")
+_TIME_WORDS = frozenset(("time", "clock"))
+
+def _words(text_command):
+    """Lowercase words of a command, without punctuation."""
+    return _WORD_RE.findall(text_command.lower())
+
+def _handle_time(text_command):
+    """Answer time questions."""
+    if _TIME_WORDS.isdisjoint(_words(text_command)):
+        return None
+    return handle_time_command()
+
+def _handle_weather(text_command):
+    """Answer weather questions, extracting a location if one is mentioned."""
+    if "weather" not in _words(text_command):
+        return None
     
+    match = _LOC_RE.search(text_command)
+    location = match.group(1).strip() if match else None
+    
+    return handle_weather_command(location)
+
+def _triggers(*phrases):
+    """Compile phrases into one case-insensitive alternation for a single scan."""
+    return re.compile("|".join(re.escape(phrase) for phrase in phrases), re.IGNORECASE)
+
+# Command handlers in priority order, each gated by a trigger pattern that
+# must cover every phrase the handler accepts; a handler is only called when
+# its pattern matches. Music handlers with open-ended parsing ("play ...",
+# remembered tracks, "artist's song") use None and are always tried. Each
+# returns a result dict or None; anything no handler claims falls through
+# to Ollama.
+COMMAND_HANDLERS = [
+    (_triggers("listening", "voice control", "no auto manage"), handle_voice_control_command),
+    (_triggers("google", "tts", "voice", "speech", "switch to say", "use say command"), handle_tts_command),
+    (_triggers("ollama", "ai", "auto start", "model", "switch to", "use "), handle_ollama_command),
+    (_triggers("time", "clock"), _handle_time),  # Whole words only, so "sometimes" falls through
+    (re.compile(r"\d"), handle_calculation),  # Simple math; every pattern needs a number
+    (_triggers("visualizer"), handle_visualizer_command),
+    (None, handle_spotify_command),     # "Spotify" commands
+    (None, handle_apple_music_command), # "Apple" commands
+    (None, handle_youtube_command),
+    (_triggers("radio", "music", "news", "npr", "rock"), handle_radio_command),
+    (_triggers("audio", "speaker", "sound", "output"), handle_audio_command),
+    (_triggers("weather"), _handle_weather),
+]
+
+# Commands that name their service up front ("spotify ...", "apple ...",
+# "youtube ...") go straight to that handler before the priority chain
+PREFIX_HANDLERS = {
+    "spotify": handle_spotify_command,
+    "apple": handle_apple_music_command,
+    "youtube": handle_youtube_command,
+}
+
+def process_command_from_user(text_command):
     if not text_command:
-        return {
-            "spoken_response": "I didn't receive any command.",
-            "opened_url": None,
-            "additional_context": None
-        }
+        return _result("I didn't receive any command.")
     
-    is_processing = True
+    _set_state(_STATE_PROCESSING, True)
     
     try:
-        logger.info(f"Processing command: {text_command}")
-        command_lower = text_command.lower().strip()
+        logger.info("Processing command: %s", text_command)
         
         # Note: Voice Control management is now handled by the "slap it" shortcut
         # No need to stop/start Voice Control here
         
-        # Try Voice Control commands
-        vc_result = handle_voice_control_command(text_command)
-        if vc_result:
-            return speak_response(vc_result)
-            
-        # Try TTS handler (for voice control commands)
-        tts_result = handle_tts_command(text_command)
-        if tts_result:
-            return speak_response(tts_result)
+        words = text_command.split(None, 1)
+        prefix_handler = PREFIX_HANDLERS.get(words[0].lower()) if words else None
+        if prefix_handler:
+            result = prefix_handler(text_command)
+            if result:
+                return speak_response(result)
         
-        # Try Ollama manager commands
-        ollama_result = handle_ollama_command(text_command)
-        if ollama_result:
-            return speak_response(ollama_result)
-        
-        # Time commands
-        if any(word in command_lower for word in ["time", "clock"]):
-            result = handle_time_command()
-            return speak_response(result)
-        
-        # Try calculation handler first (for simple math)
-        calc_result = handle_calculation(text_command)
-        if calc_result:
-            return speak_response(calc_result)
-            
-        # Try visualizer handler
-        viz_result = handle_visualizer_command(text_command)
-        if viz_result:
-            return speak_response(viz_result)
-            
-        # Try Spotify handler (for "Spotify" commands)
-        spotify_result = handle_spotify_command(text_command)
-        if spotify_result:
-            return speak_response(spotify_result)
-                
-        # Try Apple Music handler (for "Apple" commands)
-        apple_result = handle_apple_music_command(text_command)
-        if apple_result:
-            return speak_response(apple_result)
-                    
-        # Try YouTube handler
-        youtube_result = handle_youtube_command(text_command)
-        if youtube_result:
-            return speak_response(youtube_result)
-                        
-        # Try radio handler
-        radio_result = handle_radio_command(text_command)
-        if radio_result:
-            return speak_response(radio_result)
-                        
-        # Try audio handler
-        audio_result = handle_audio_command(text_command)
-        if audio_result:
-            return speak_response(audio_result)
-                        
-        # Weather commands
-        if "weather" in command_lower:
-            # Extract location if mentioned
-            location = None
-            if " in " in command_lower:
-                location_part = command_lower.split(" in ", 1)[1]
-                location = location_part.replace("?", "").strip()
-            elif " for " in command_lower:
-                location_part = command_lower.split(" for ", 1)[1]
-                location = location_part.replace("?", "").strip()
-            
-            result = handle_weather_command(location)
-            return speak_response(result)
+        # The first handler that recognizes the command wins; later ones are skipped
+        for trigger, handler in COMMAND_HANDLERS:
+            if trigger is not None and not trigger.search(text_command):
+                continue
+            result = handler(text_command)
+            if result:
+                return speak_response(result)
                         
         # Everything else goes to Ollama for conversation (streaming with real-time speech)
         result = handle_ollama_query(text_command)
@@ -318,14 +504,28 @@ def process_command_from_user(text_command):
         return result
         
     finally:
-        is_processing = False
+        _set_state(_STATE_PROCESSING, False)
 
 # --- Flask Server ---
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson when available."""
+    
+    def dumps(self, obj, **kwargs):
+        return json_utils.dumps(obj)
+    
+    def loads(self, s, **kwargs):
+        return json_utils.loads(s)
+
 flask_app = Flask(__name__)
+flask_app.json = FastJSONProvider(flask_app)
+
+def _json(payload):
+    """Build a JSON response straight from encoded bytes, bypassing jsonify."""
+    return flask_app.response_class(json_utils.dumpb(payload), mimetype='application/json')
 
 @flask_app.route('/', methods=['GET'])
 def home():
-    return jsonify({
+    return _json({
         "status": "online",
         "app": APP_NAME,
         "version": APP_VERSION
@@ -333,15 +533,75 @@ def home():
 
 @flask_app.route('/status', methods=['GET'])
 def status():
-    return jsonify({
+    state = _state
+    # Replies waiting for the speech thread count as speaking, so there is no
+    # "ready" gap between a command finishing and its reply being picked up
+    if SPEECH_Q.unfinished_tasks:
+        state |= _STATE_SPEAKING
+    return _json({
         "status": "online",
-        "is_speaking": is_speaking,
-        "is_processing": is_processing,
-        "ready_for_command": not is_speaking and not is_processing
+        "state": state,
+        "is_speaking": bool(state & _STATE_SPEAKING),
+        "is_processing": bool(state & _STATE_PROCESSING),
+        "ready_for_command": state == _STATE_IDLE
     })
 
+# Background workers for queued commands, keyed by job id
+_WORKERS = ThreadPoolExecutor(max_workers=4, thread_name_prefix="julie-command")
+_JOBS = {}
+_jobs_lock = threading.Lock()
+# Finished jobs nobody fetched (the Shortcuts scripts never read results)
+# are dropped this many seconds after they complete
+JOB_TTL = 300
+
+def _mark_finished(future):
+    """Done-callback: record when a job finished, for TTL eviction."""
+    future.finished_at = time.monotonic()
+
+def _submit_command(user_text_command):
+    """Run a command on the worker pool and return its job id."""
+    job_id = uuid.uuid4().hex
+    future = _WORKERS.submit(process_command_from_user, user_text_command)
+    future.add_done_callback(_mark_finished)
+    cutoff = time.monotonic() - JOB_TTL
+    with _jobs_lock:
+        expired = [key for key, job in _JOBS.items()
+                   if getattr(job, "finished_at", cutoff) < cutoff]
+        for key in expired:
+            del _JOBS[key]
+        _JOBS[job_id] = future
+    return job_id
+
+def _job_response(job_id):
+    """Report a queued command: 404 unknown, 202 still running, 200/500 when finished."""
+    with _jobs_lock:
+        future = _JOBS.get(job_id)
+        if future is None:
+            return _json({
+                "status": "error",
+                "message": "Unknown job id"
+            }), 404
+        if not future.done():
+            return _json({"status": "pending", "job_id": job_id}), 202
+        # Finished jobs are handed out once
+        del _JOBS[job_id]
+    
+    try:
+        return _json({
+            "status": "success",
+            "message": "Command processed",
+            "details": future.result()
+        }), 200
+    except Exception as e:
+        logger.error("Error processing command: %s", e)
+        return _json({
+            "status": "error",
+            "message": f"Error: {str(e)}"
+        }), 500
+
 @flask_app.route('/command', methods=['POST'])
 def command_endpoint():
+    """Queue a command and return immediately; poll /command/<task_id> for the outcome."""
     try:
         if request.is_json:
             data = request.json
@@ -350,30 +610,59 @@ def command_endpoint():
             user_text_command = request.form.get('text_command')
         
         if user_text_command:
-            result = process_command_from_user(user_text_command)
-            return jsonify({
-                "status": "success",
-                "message": "Command processed",
-                "details": result
-            }), 200
+            return _json({
+                "status": "accepted",
+                "task_id": _submit_command(user_text_command)
+            }), 202
         else:
-            return jsonify({
+            return _json({
                 "status": "error",
                 "message": "No text_command provided"
             }), 400
     except Exception as e:
-        logger.error(f"Error processing command: {e}")
-        return jsonify({
+        logger.error("Error processing command: %s", e)
+        return _json({
             "status": "error",
             "message": f"Error: {str(e)}"
         }), 500
 
+@flask_app.route('/command/<task_id>', methods=['GET'])
+def command_result_endpoint(task_id):
+    return _job_response(task_id)
+
+@flask_app.route('/activate_listening', methods=['POST'])
+def activate_listening_endpoint():
+    """Queue a command and return immediately; poll /result/<job_id> for the outcome."""
+    user_text_command = request.values.get('text_command')
+    if not user_text_command and request.is_json:
+        user_text_command = (request.get_json(silent=True) or {}).get('text_command')
+    
+    if not user_text_command:
+        return _json({
+            "status": "error",
+            "message": "No text_command provided"
+        }), 400
+    
+    return _json({
+        "status": "accepted",
+        "job_id": _submit_command(user_text_command)
+    }), 202
+
+@flask_app.route('/result/<job_id>', methods=['GET'])
+def result_endpoint(job_id):
+    return _job_response(job_id)
+
 def run_flask_server():
-    logger.info(f"Starting Flask server on http://127.0.0.1:{FLASK_PORT}")
+    logger.info("Starting Flask server on http://127.0.0.1:%s", FLASK_PORT)
     try:
-        flask_app.run(host='127.0.0.1', port=FLASK_PORT, debug=False, threaded=True)
+        if serve is not None:
+            # Production WSGI server with a fixed worker pool and keep-alive
+            serve(flask_app, host='127.0.0.1', port=FLASK_PORT, threads=8,
+                  connection_limit=64, channel_timeout=30)
+        else:
+            flask_app.run(host='127.0.0.1', port=FLASK_PORT, debug=False, threaded=True)
     except Exception as e:
-        logger.error(f"Could not start Flask server: {e}")
+        logger.error("Could not start Flask server: %s", e)
 
 # --- Menu Bar App ---
 class JulieJulieRumpsApp(rumps.App):
@@ -394,6 +683,10 @@ class JulieJulieRumpsApp(rumps.App):
         # Start Flask server
         self.web_server_thread = threading.Thread(target=run_flask_server, daemon=True)
         self.web_server_thread.start()
+        
+        # Warm up connections and resolve the default weather location while the app is idle
+        threading.Thread(target=_warm_connections, daemon=True).start()
+        threading.Thread(target=_warm_weather_cache, args=(DEFAULT_LOCATION,), daemon=True).start()
 
     @rumps.clicked("Enter Command...")
     def enter_command(self, _):
@@ -406,8 +699,11 @@ class JulieJulieRumpsApp(rumps.App):
         ).run()
         
         if response.clicked and response.text:
-            logger.info(f"Command entered via menu: {response.text}")
-            result = process_command_from_user(response.text)
+            logger.info("Command entered via menu: %s", response.text)
+            if _TIME_RE.match(response.text):
+                speak_response(handle_time_command())
+            else:
+                result = process_command_from_user(response.text)
 
     @rumps.clicked("Status")
     def show_status(self, _):
@@ -417,11 +713,11 @@ class JulieJulieRumpsApp(rumps.App):
         )
 
     def run(self):
-        logger.info(f"Starting {APP_NAME} v{APP_VERSION}")
+        logger.info("Starting %s v%s", APP_NAME, APP_VERSION)
         try:
             super(JulieJulieRumpsApp, self).run()
         finally:
-            logger.info(f"{APP_NAME} is shutting down.")
+            logger.info("%s is shutting down.", APP_NAME)
             cleanup_ollama()
 
 if __name__ == '__main__':
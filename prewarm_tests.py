@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Pre-compile the project so test runs skip bytecode compilation.
+
+Run with: python prewarm_tests.py
+Then export the printed JULIE_TEST_PY line so test_runner.py uses this interpreter.
+Set PYTHONPYCACHEPREFIX first to keep the compiled files outside the source tree.
+"""
+
+import compileall
+import os
+import sys
+from pathlib import Path
+
+TARGETS = ["handlers", "utils", "tests"]
+
+def main():
+    project_dir = Path(__file__).parent
+    os.chdir(project_dir)
+    
+    ok = all(compileall.compile_dir(target, quiet=1) for target in TARGETS)
+    ok = compileall.compile_file("julie_julie_app.py", quiet=1) and ok
+    if not ok:
+        print("Some files failed to compile; see the errors above.")
+        return 1
+    
+    prefix = os.environ.get("PYTHONPYCACHEPREFIX")
+    if prefix:
+        print(f"export PYTHONPYCACHEPREFIX={prefix}")
+    print(f"export JULIE_TEST_PY={sys.executable}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
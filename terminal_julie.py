@@ -16,10 +16,16 @@ import time
 # Configuration
 SERVER_URL = "http://127.0.0.1:58586"
 
+# One keep-alive connection to the local server for the whole session
+SESSION = requests.Session()
+
+# "Julie Julie <command> stop"
+COMMAND_PATTERN = re.compile(r'Julie\s+Julie\s+(.+?)\s+stop', re.IGNORECASE)
+
 def check_server():
     """Check if the Julie Julie server is running."""
     try:
-        response = requests.get(SERVER_URL, timeout=2)
+        response = SESSION.get(SERVER_URL, timeout=2)
         if response.status_code == 200:
             return True
         return False
@@ -29,13 +35,13 @@ def check_server():
 def process_command(command):
     """Send the command to Julie Julie server."""
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{SERVER_URL}/activate_listening", 
             data={"text_command": command}
         )
         
-        if response.status_code == 200:
-            print(f"Julie Julie processed: '{command}'")
+        if response.status_code in (200, 202):
+            print(f"Julie Julie accepted: '{command}'")
             return True
         else:
             print(f"Error: Server returned status code {response.status_code}")
@@ -60,9 +66,6 @@ def main():
     print("Example: 'Julie Julie what time is it stop'")
     print("Type 'exit' to quit\n")
     
-    # Compile regex pattern for command extraction
-    pattern = re.compile(r'Julie\s+Julie\s+(.+?)\s+stop', re.IGNORECASE)
-    
     # Main input loop
     while True:
         try:
@@ -75,7 +78,7 @@ def main():
                 break
             
             # Try to match the pattern
-            match = pattern.search(user_input)
+            match = COMMAND_PATTERN.search(user_input)
             
             if match:
                 # Extract the command part
@@ -11,22 +11,32 @@ Usage:
     python test_runner.py --integration      # Run only integration tests
     python test_runner.py --coverage         # Run with coverage report
     python test_runner.py --verbose          # Run with verbose output
+    python test_runner.py --serial           # Run in a single process (no xdist)
+    python test_runner.py --full             # Don't stop at the first failure
+    python test_runner.py --last-failed      # Re-run only the tests that failed last time
+
+Set JULIE_TEST_PY to run pytest with a different (pre-warmed) interpreter;
+see prewarm_tests.py.
 """
 
 import subprocess
 import sys
 import os
 import argparse
+import hashlib
+import importlib.util
+import shlex
 from pathlib import Path
 
+DEPS_SENTINEL = Path(".pytest_deps_ok")
+
 def run_command(cmd, description):
-    """Run a command and handle errors."""
+    """Run a command (an argv list) and handle errors."""
     print(f"\n{description}")
     print("=" * len(description))
     
     try:
-        result = subprocess.run(cmd, shell=True, check=True, 
-                              capture_output=False, text=True)
+        subprocess.run(cmd, check=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error: {e}")
@@ -34,16 +44,26 @@ def run_command(cmd, description):
 
 def install_dependencies():
     """Install test dependencies if needed."""
-    print("Checking and installing test dependencies...")
+    dependencies = ["pytest", "pytest-cov", "pytest-mock", "pytest-xdist", "time-machine", "requests"]
+    import_names = {"pytest-xdist": "xdist"}
     
-    dependencies = ["pytest", "pytest-cov", "pytest-mock", "requests"]
+    # Skip the check when this interpreter already passed it for the same dependency set
+    key = hashlib.sha1(repr((sys.executable, sorted(dependencies))).encode()).hexdigest()
+    try:
+        if DEPS_SENTINEL.read_text(errors="ignore") == key:
+            return
+    except OSError:
+        pass
+    
+    print("Checking and installing test dependencies...")
     for dep in dependencies:
-        try:
-            __import__(dep.replace("-", "_"))
-        except ImportError:
+        # find_spec locates the package without running its import-time code
+        if importlib.util.find_spec(import_names.get(dep, dep.replace("-", "_"))) is None:
             print(f"Installing {dep}...")
             subprocess.run([sys.executable, "-m", "pip", "install", dep], 
                          check=True, capture_output=True)
+    
+    DEPS_SENTINEL.write_text(key)
 
 def main():
     parser = argparse.ArgumentParser(description="Run Julie Julie tests")
@@ -57,6 +77,12 @@ def main():
                        help="Run with coverage report")
     parser.add_argument("--verbose", action="store_true",
                        help="Run with verbose output")
+    parser.add_argument("--serial", action="store_true",
+                       help="Run tests in a single process instead of in parallel")
+    parser.add_argument("--full", action="store_true",
+                       help="Run every selected test instead of stopping at the first failure")
+    parser.add_argument("--last-failed", action="store_true",
+                       help="Re-run only the tests that failed on the previous run")
     
     args = parser.parse_args()
     
@@ -64,11 +90,15 @@ def main():
     project_dir = Path(__file__).parent
     os.chdir(project_dir)
     
-    # Install dependencies
-    install_dependencies()
+    # Prefer a pre-warmed interpreter when one is configured
+    python = os.environ.get("JULIE_TEST_PY", sys.executable)
+    
+    # Install dependencies (only meaningful for the interpreter running this script)
+    if python == sys.executable:
+        install_dependencies()
     
     # Build pytest command
-    pytest_cmd = [sys.executable, "-m", "pytest"]
+    pytest_cmd = [python, "-m", "pytest"]
     
     # Add test selection
     if args.unit:
@@ -76,7 +106,8 @@ def main():
             "tests/test_command_handlers.py",
             "tests/test_core_logic.py",
             "tests/test_flask_api.py",
-            "tests/test_simple_integration.py"
+            "tests/test_command_recognition.py",
+            "tests/test_output_utils.py"
         ])
     elif args.integration:
         pytest_cmd.extend(["tests/test_integration.py"])
@@ -88,10 +119,24 @@ def main():
             "tests/test_command_handlers.py",
             "tests/test_core_logic.py", 
             "tests/test_flask_api.py",
-            "tests/test_simple_integration.py"
+            "tests/test_command_recognition.py",
+            "tests/test_output_utils.py"
         ])
     
     # Add options
+    if not args.serial:
+        # loadfile keeps each file on one worker so module-level setup runs once
+        pytest_cmd.extend(["-n", "auto", "--dist=loadfile"])
+    
+    if args.last_failed:
+        pytest_cmd.extend(["--lf"])
+    
+    if not args.full:
+        # Stop at the first failure and run previously failing tests first
+        pytest_cmd.extend(["-x"])
+        if not args.last_failed:
+            pytest_cmd.extend(["--ff"])
+    
     if args.verbose:
         pytest_cmd.extend(["-v"])
     
@@ -105,9 +150,9 @@ def main():
     # Run tests
     print("Running Julie Julie Test Suite...")
     print("================================")
-    print(f"Command: {' '.join(pytest_cmd)}")
+    print(f"Command: {shlex.join(pytest_cmd)}")
     
-    success = run_command(' '.join(pytest_cmd), "Executing Tests")
+    success = run_command(pytest_cmd, "Executing Tests")
     
     if success:
         print("\n✅ All tests completed successfully!")
@@ -121,6 +166,8 @@ def main():
         print(f"  {sys.executable} test_runner.py --integration")
         print(f"  {sys.executable} test_runner.py --all          # Including server tests")
         print(f"  {sys.executable} test_runner.py --coverage")
+        print(f"  {sys.executable} test_runner.py --serial       # Without parallel workers")
+        print(f"  {sys.executable} test_runner.py --full         # Don't stop at the first failure")
     else:
         print("\n❌ Some tests failed. Check the output above for details.")
         sys.exit(1)
@@ -5,21 +5,39 @@ Tests Google TTS, say fallback, command handling, and error conditions.
 
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
+import copy
 import tempfile
 import os
 import json
 import subprocess
+from types import SimpleNamespace
 
 # Import the handler
 import sys
 sys.path.append('/Users/bard/Code/Julie-Julie-M1')
 from handlers.tts_handler import TTSManager, speak_text, set_tts_preference, get_tts_status, handle_tts_command
 
+def _google_stack(mock_tts, mock_tempfile, audio=b'fake audio data', path='/tmp/fake_audio.mp3'):
+    """Wire the Google TTS client, its response and the temp file onto the given patches."""
+    client = mock_tts.TextToSpeechClient.return_value
+    response = client.synthesize_speech.return_value
+    response.audio_content = audio
+    audio_file = mock_tempfile.return_value.__enter__.return_value
+    audio_file.name = path
+    return SimpleNamespace(client=client, response=response, file=audio_file)
+
 class TestTTSManager(unittest.TestCase):
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one TTSManager with the gcloud probe mocked out."""
+        with patch('subprocess.run', return_value=MagicMock(returncode=1)):
+            cls._base_manager = TTSManager()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.tts_manager = TTSManager()
+        # A shallow copy keeps per-test attribute changes isolated without re-probing gcloud
+        self.tts_manager = copy.copy(self._base_manager)
     
     def test_init_without_credentials(self):
         """Test TTSManager initialization without Google credentials."""
@@ -74,29 +92,16 @@ class TestTTSManager(unittest.TestCase):
     @patch('os.unlink')
     def test_google_tts_success(self, mock_unlink, mock_tempfile, mock_subprocess, mock_tts):
         """Test successful Google TTS."""
-        # Mock the Google TTS client and response
-        mock_client = MagicMock()
-        mock_tts.TextToSpeechClient.return_value = mock_client
-        
-        mock_response = MagicMock()
-        mock_response.audio_content = b'fake audio data'
-        mock_client.synthesize_speech.return_value = mock_response
-        
-        # Mock temporary file
-        mock_file = MagicMock()
-        mock_file.name = '/tmp/fake_audio.mp3'
-        mock_tempfile.return_value.__enter__.return_value = mock_file
-        
-        # Mock afplay
-        mock_subprocess.return_value = None
+        stack = _google_stack(mock_tts, mock_tempfile)
+        mock_subprocess.return_value = None  # afplay succeeds
         
         result = self.tts_manager._google_tts("Hello world")
         self.assertTrue(result)
         
         # Verify calls
-        mock_client.synthesize_speech.assert_called_once()
-        mock_subprocess.assert_called_once_with(['afplay', '/tmp/fake_audio.mp3'], check=True)
-        mock_unlink.assert_called_once_with('/tmp/fake_audio.mp3')
+        stack.client.synthesize_speech.assert_called_once()
+        mock_subprocess.assert_called_once_with(['afplay', stack.file.name], check=True)
+        mock_unlink.assert_called_once_with(stack.file.name)
     
     def test_google_tts_import_error(self):
         """Test Google TTS when library is not installed."""
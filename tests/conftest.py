@@ -0,0 +1,119 @@
+# tests/conftest.py
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+# Make the project root importable once for every test module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def assert_spoken(result, *fragments):
+    """Assert that a handler answered and its spoken response contains every fragment."""
+    assert result is not None
+    spoken = result["spoken_response"]
+    assert all(fragment in spoken for fragment in fragments), (spoken, fragments)
+
+
+def _ollama_stub(user_query):
+    """Canned stand-in for julie_julie_app.handle_ollama_query."""
+    return {"spoken_response": "stub", "opened_url": None, "additional_context": None}
+
+
+@pytest.fixture(autouse=True)
+def mock_ollama(monkeypatch):
+    """
+    Keep the Ollama fallback off the network for every test that loaded the app.
+    Tests that care about the call assert on (or override) the returned mock.
+    """
+    stub = MagicMock(wraps=_ollama_stub)
+    app = sys.modules.get("julie_julie_app")
+    if app is not None:
+        monkeypatch.setattr(app, "handle_ollama_query", stub)
+    return stub
+
+
+@pytest.fixture(scope="session")
+def _shared_mocks():
+    """Build the browser and subprocess mocks once for the whole run."""
+    return SimpleNamespace(browser=MagicMock(), sub=MagicMock())
+
+
+@pytest.fixture(autouse=True)
+def fast_mocks(_shared_mocks, monkeypatch):
+    """
+    Keep tests from opening browser tabs or running real commands.
+    The shared mocks are reset rather than rebuilt before each test.
+    """
+    _shared_mocks.browser.reset_mock(return_value=True, side_effect=True)
+    _shared_mocks.sub.reset_mock(return_value=True, side_effect=True)
+    _shared_mocks.sub.return_value = MagicMock(returncode=0, stdout="")
+    monkeypatch.setattr("webbrowser.open", _shared_mocks.browser)
+    monkeypatch.setattr("subprocess.run", _shared_mocks.sub)
+    yield _shared_mocks
+    # Let queued speech reach the mock before it is removed
+    app = sys.modules.get("julie_julie_app")
+    if app is not None:
+        app.SPEECH_Q.join()
+
+
+@pytest.fixture(scope="session")
+def http():
+    """One pooled requests.Session for every test that talks to the live server."""
+    session = requests.Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Drive the Flask app in-process through one WSGI test client."""
+    from julie_julie_app import flask_app
+
+    flask_app.testing = True
+    return flask_app.test_client()
+
+
+def wait_for_task(client, task_id):
+    """Wait for a queued command to finish and return its result response."""
+    from julie_julie_app import _JOBS
+
+    try:
+        _JOBS[task_id].result(timeout=5)
+    except Exception:
+        pass  # The result endpoint reports worker errors
+    return client.get(f"/command/{task_id}")
+
+
+def run_command(client, **kwargs):
+    """POST a command, then wait for its task and fetch the result."""
+    response = client.post("/command", **kwargs)
+    assert response.status_code == 202
+    return wait_for_task(client, response.get_json()["task_id"])
+
+
+@pytest.fixture(scope="session")
+def live_server(http):
+    """
+    Serve the app on its real port from a daemon thread for the whole run.
+    Polls the root endpoint until it answers instead of sleeping a fixed time.
+    """
+    from julie_julie_app import run_flask_server, FLASK_PORT
+
+    base_url = f"http://127.0.0.1:{FLASK_PORT}"
+    threading.Thread(target=run_flask_server, daemon=True).start()
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            http.get(f"{base_url}/", timeout=0.2)
+            break
+        except requests.exceptions.RequestException:
+            if time.monotonic() > deadline:
+                pytest.fail(f"Server did not start on {base_url}")
+            time.sleep(0.05)
+    return base_url
@@ -0,0 +1,36 @@
+# tests/test_command_recognition.py
+# Different phrasings of the same request, run straight through the command processor.
+import pytest
+
+from julie_julie_app import process_command_from_user
+
+@pytest.mark.parametrize("command", [
+    "what time is it",
+    "What's the time?",
+    "tell me the time",
+    "current time",
+    "what's the clock say",
+])
+def test_time_command_variations(command):
+    """Test various ways of asking for time."""
+    result = process_command_from_user(command)
+    assert result is not None
+    assert "spoken_response" in result
+    assert "time" in result["spoken_response"].lower()
+
+# "what is ..." and "calculate ..." phrasings are not parsed by the calculation
+# handler yet and fall through to the Ollama fallback
+_UNPARSED = pytest.mark.xfail(reason="calculation handler does not parse this phrasing", strict=True)
+
+@pytest.mark.parametrize("command,figure", [
+    pytest.param("what is 2 plus 2", "4", marks=_UNPARSED),
+    pytest.param("calculate 5 times 3", "15", marks=_UNPARSED),
+    ("2 + 2", "4"),
+    ("5 * 3", "15"),
+    ("what's 10 minus 4", "6"),
+])
+def test_calculation_variations(command, figure):
+    """Test various ways of asking for calculations."""
+    result = process_command_from_user(command)
+    assert result is not None
+    assert figure in result["spoken_response"]
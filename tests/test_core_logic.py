@@ -1,172 +1,327 @@
 # tests/test_core_logic.py
-import unittest
-from unittest.mock import patch, MagicMock
-import sys
-import os
+from unittest.mock import patch, MagicMock, Mock
+import pytest
+import json
+import requests
+import threading
 from datetime import datetime
 
-# Add the parent directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 # Import the core functions
-from julie_julie_app import handle_time_command, handle_weather_command, process_command_from_user
-
-class TestTimeHandler(unittest.TestCase):
-    """Test time-related functionality."""
-    
-    def test_time_command_structure(self):
-        """Test that time command returns proper structure."""
-        result = handle_time_command()
-        
-        # Check that result has the expected structure
-        self.assertIsInstance(result, dict)
-        self.assertIn("spoken_response", result)
-        self.assertIn("opened_url", result)
-        self.assertIn("additional_context", result)
-        
-        # Check that spoken_response contains time information
-        self.assertIsInstance(result["spoken_response"], str)
-        self.assertIn("time", result["spoken_response"].lower())
-        
-        # opened_url should be None for time commands
-        self.assertIsNone(result["opened_url"])
-    
-    def test_time_command_format(self):
-        """Test that time is formatted correctly."""
-        result = handle_time_command()
-        spoken_response = result["spoken_response"]
-        
-        # Should contain "AM" or "PM"
-        self.assertTrue("AM" in spoken_response or "PM" in spoken_response)
-        
-        # Should contain "current time"
-        self.assertIn("current time", spoken_response.lower())
-
-class TestWeatherHandler(unittest.TestCase):
-    """Test weather functionality."""
-    
-    @patch('requests.get')
-    def test_weather_with_valid_response(self, mock_get):
-        """Test weather handler with mocked valid API responses."""
-        # Mock the geocoding response
-        mock_geo_response = MagicMock()
-        mock_geo_response.status_code = 200
-        mock_geo_response.json.return_value = [{
-            'lat': '39.0997',
-            'lon': '-94.5786',
-            'display_name': 'Kansas City, Jackson County, Missouri, United States'
-        }]
-        
-        # Mock the NWS points response
-        mock_nws_response = MagicMock()
-        mock_nws_response.status_code = 200
-        mock_nws_response.json.return_value = {
-            'properties': {
-                'forecast': 'https://api.weather.gov/gridpoints/EAX/34,70/forecast'
-            }
-        }
-        
-        # Mock the forecast response
-        mock_forecast_response = MagicMock()
-        mock_forecast_response.status_code = 200
-        mock_forecast_response.json.return_value = {
-            'properties': {
-                'periods': [{
-                    'temperature': 75,
-                    'temperatureUnit': 'F',
-                    'shortForecast': 'Sunny',
-                    'detailedForecast': 'Sunny with clear skies'
-                }]
-            }
+from julie_julie_app import (
+    handle_time_command, handle_weather_command, handle_ollama_query,
+    _ollama_body, _ollama_frame,
+    _TIME_RE, _geocode, _forecast_url, _warm_weather_cache, DEFAULT_LOCATION,
+    process_command_from_user, speak, SPEECH_Q, _STATE_SPEAKING
+)
+import julie_julie_app
+
+# Time handler
+
+@pytest.fixture(scope="module")
+def time_result():
+    """Fetch one time reply at a frozen clock for the tests that inspect it."""
+    time_machine = pytest.importorskip("time_machine")
+    with time_machine.travel("2024-06-15 14:30:00", tick=False):
+        return handle_time_command()
+
+def test_time_command_structure(time_result):
+    """Test that time command returns proper structure."""
+    result = time_result
+
+    # Check that result has the expected structure
+    assert isinstance(result, dict)
+    assert "spoken_response" in result
+    assert "opened_url" in result
+    assert "additional_context" in result
+
+    # Check that spoken_response contains time information
+    assert isinstance(result["spoken_response"], str)
+    assert "time" in result["spoken_response"].lower()
+
+    # opened_url should be None for time commands
+    assert result["opened_url"] is None
+
+def test_time_command_format(time_result):
+    """Test that time is formatted correctly."""
+    assert time_result["spoken_response"] == "The current time is 02:30 PM."
+
+@patch('julie_julie_app.time')
+def test_time_formatted_once_per_minute(mock_time):
+    """Test that the time string is reused within the same minute."""
+    mock_time.time.side_effect = [6000.0, 6030.0, 6060.0]
+    mock_time.strftime.side_effect = ["01:40 AM", "01:41 AM"]
+
+    assert "01:40 AM" in handle_time_command()["spoken_response"]
+    assert "01:40 AM" in handle_time_command()["spoken_response"]
+    assert "01:41 AM" in handle_time_command()["spoken_response"]
+    assert mock_time.strftime.call_count == 2
+
+def test_time_fast_path_pattern():
+    """Test which menu commands take the direct time path."""
+    for command in ["what time is it", "What's the time?", "time", "what is the current time"]:
+        assert _TIME_RE.match(command), command
+    for command in ["time to go to bed", "set a timer", "what time is it in Tokyo"]:
+        assert not _TIME_RE.match(command), command
+
+# Weather handler
+
+def _canned_response(payload, status_code=200):
+    """Build a spec'd response mock carrying a JSON payload."""
+    response = Mock(spec=requests.Response)
+    response.status_code = status_code
+    response.content = json.dumps(payload).encode()
+    return response
+
+# Canned weather API responses, built once and shared by the weather tests
+_WEATHER_RESPONSES = (
+    ("nominatim.openstreetmap.org", _canned_response([{
+        'lat': '39.0997',
+        'lon': '-94.5786',
+        'display_name': 'Kansas City, Jackson County, Missouri, United States'
+    }])),
+    ("api.weather.gov/points", _canned_response({
+        'properties': {
+            'forecast': 'https://api.weather.gov/gridpoints/EAX/34,70/forecast'
         }
-        
-        # Configure the mock to return different responses for different URLs
-        def mock_get_side_effect(url, **kwargs):
-            if 'nominatim.openstreetmap.org' in url:
-                return mock_geo_response
-            elif 'api.weather.gov/points' in url:
-                return mock_nws_response
-            elif 'forecast' in url:
-                return mock_forecast_response
-            return MagicMock(status_code=404)
-        
-        mock_get.side_effect = mock_get_side_effect
-        
-        result = handle_weather_command("Kansas City")
-        
-        self.assertIsNotNone(result)
-        self.assertIn("spoken_response", result)
-        self.assertIn("75", result["spoken_response"])
-        self.assertIn("Sunny", result["spoken_response"])
-    
-    @patch('requests.get')
-    def test_weather_with_api_failure(self, mock_get):
-        """Test weather handler when API calls fail."""
-        mock_get.side_effect = Exception("Network error")
-        
-        result = handle_weather_command("Invalid Location")
-        
-        self.assertIsNotNone(result)
-        self.assertIn("spoken_response", result)
-        self.assertIn("couldn't", result["spoken_response"].lower())
-    
-    def test_weather_default_location(self):
-        """Test weather handler with no location specified."""
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = Exception("Network error")  # Force failure for testing
-            
-            result = handle_weather_command()  # No location specified
-            
-            self.assertIsNotNone(result)
-            self.assertIn("spoken_response", result)
-
-class TestCommandProcessing(unittest.TestCase):
-    """Test the main command processing logic."""
-    
-    @patch('subprocess.run')  # Mock the 'say' command
-    def test_time_command_processing(self, mock_subprocess):
-        """Test that time commands are processed correctly."""
-        mock_subprocess.return_value = MagicMock(returncode=0)
-        
-        result = process_command_from_user("what time is it")
-        
-        self.assertIsNotNone(result)
-        self.assertIn("spoken_response", result)
-        self.assertIn("time", result["spoken_response"].lower())
-        
-        # Verify that the 'say' command was called
-        mock_subprocess.assert_called()
-    
-    @patch('subprocess.run')
-    def test_empty_command(self, mock_subprocess):
-        """Test handling of empty commands."""
-        result = process_command_from_user("")
-        
-        self.assertIsNotNone(result)
-        self.assertIn("didn't receive", result["spoken_response"])
-    
-    @patch('subprocess.run')
-    def test_none_command(self, mock_subprocess):
-        """Test handling of None commands."""
-        result = process_command_from_user(None)
-        
-        self.assertIsNotNone(result)
-        self.assertIn("didn't receive", result["spoken_response"])
-    
-    @patch('subprocess.run')
-    @patch('julie_julie_app.handle_ollama_query')
-    def test_fallback_to_ollama(self, mock_ollama, mock_subprocess):
-        """Test that unrecognized commands fall back to Ollama."""
-        mock_ollama.return_value = {
-            "spoken_response": "I understand you're asking about something.",
-            "opened_url": None,
-            "additional_context": "Processed by Ollama"
+    })),
+    ("forecast", _canned_response({
+        'properties': {
+            'periods': [{
+                'temperature': 75,
+                'temperatureUnit': 'F',
+                'shortForecast': 'Sunny',
+                'detailedForecast': 'Sunny with clear skies'
+            }]
         }
-        
-        result = process_command_from_user("tell me a random fact")
-        
-        self.assertIsNotNone(result)
-        mock_ollama.assert_called_once()
-
-if __name__ == '__main__':
-    unittest.main()
+    })),
+)
+_MISSING_RESPONSE = _canned_response({}, status_code=404)
+
+def _weather_get(url, **kwargs):
+    """Return the canned response whose URL fragment matches, or a 404."""
+    return next((response for fragment, response in _WEATHER_RESPONSES if fragment in url),
+                _MISSING_RESPONSE)
+
+@pytest.fixture
+def mock_get():
+    """Patch HTTP.get and start with empty geocoding caches."""
+    _geocode.cache_clear()
+    _forecast_url.cache_clear()
+    with patch('julie_julie_app.HTTP.get') as mock:
+        yield mock
+
+@pytest.fixture
+def weather_api(mock_get):
+    """Route mocked HTTP.get calls to the canned geocode/NWS responses."""
+    mock_get.side_effect = _weather_get
+    return mock_get
+
+def test_weather_with_valid_response(weather_api):
+    """Test weather handler with mocked valid API responses."""
+    result = handle_weather_command("Kansas City")
+
+    assert result is not None
+    assert "spoken_response" in result
+    assert "75" in result["spoken_response"]
+    assert "Sunny" in result["spoken_response"]
+
+def test_weather_repeat_lookup_uses_cache(weather_api):
+    """Test that repeated lookups only fetch the forecast."""
+    handle_weather_command("Kansas City")
+    assert weather_api.call_count == 3
+
+    result = handle_weather_command("kansas city ")
+    assert weather_api.call_count == 4
+    assert "Sunny" in result["spoken_response"]
+
+def test_warmed_default_location_only_fetches_forecast(weather_api):
+    """Test that warming the cache leaves only the forecast request."""
+    _warm_weather_cache(DEFAULT_LOCATION)
+    assert weather_api.call_count == 2
+
+    handle_weather_command()
+    assert weather_api.call_count == 3
+
+@patch('julie_julie_app.handle_weather_command')
+def test_weather_location_extraction(mock_weather):
+    """Test that the location is pulled out of weather requests."""
+    mock_weather.return_value = None
+    for command, location in [
+        ("what is the weather in Paris?", "Paris"),
+        ("weather for new york", "new york"),
+        ("how is the weather", None),
+    ]:
+        process_command_from_user(command)
+        mock_weather.assert_called_with(location)
+
+def test_weather_with_api_failure(mock_get):
+    """Test weather handler when API calls fail."""
+    mock_get.side_effect = Exception("Network error")
+
+    result = handle_weather_command("Invalid Location")
+
+    assert result is not None
+    assert "spoken_response" in result
+    assert "couldn't" in result["spoken_response"].lower()
+
+def test_weather_default_location(mock_get):
+    """Test weather handler with no location specified."""
+    mock_get.side_effect = Exception("Network error")  # Force failure for testing
+
+    result = handle_weather_command()  # No location specified
+
+    assert result is not None
+    assert "spoken_response" in result
+
+# Ollama streaming
+
+@patch('julie_julie_app.ensure_ollama_available', return_value=True)
+@patch('julie_julie_app.speech_stream')
+@patch('julie_julie_app.OLLAMA.post')
+def test_sentences_spoken_as_they_complete(mock_post, mock_stream, mock_available):
+    """Test that several sentences in one token are each spoken."""
+    mock_response = MagicMock(status_code=200)
+    # Frames are split across chunks the way a socket delivers them
+    mock_response.raw.stream.return_value = [
+        b'{"response": "Hi. How are", "done": false}\n{"resp',
+        b'onse": " you? Fine! Bye", "done": false}\n',
+        b'not json\n{"response": "", "done": true}',
+    ]
+    mock_post.return_value.__enter__.return_value = mock_response
+    say = MagicMock()
+    mock_stream.return_value.__enter__.return_value = say
+
+    result = handle_ollama_query("hello")
+
+    spoken = [call.args[0] for call in say.call_args_list]
+    assert spoken == ["Hi.", "How are you?", "Fine!", "Bye"]
+    assert result["spoken_response"] == "Hi. How are you? Fine! Bye"
+
+@patch('julie_julie_app.ensure_ollama_available', return_value=True)
+@patch('julie_julie_app.speech_stream')
+@patch('julie_julie_app.OLLAMA.post')
+def test_streamed_reply_reports_speaking(mock_post, mock_stream, mock_available):
+    """Test that a streamed reply holds the speaking flag while it is spoken."""
+    mock_response = MagicMock(status_code=200)
+    mock_response.raw.stream.return_value = [b'{"response": "Hi.", "done": true}\n']
+    mock_post.return_value.__enter__.return_value = mock_response
+    flags = []
+    say = MagicMock(side_effect=lambda text: flags.append(julie_julie_app._state & _STATE_SPEAKING))
+    mock_stream.return_value.__enter__.return_value = say
+
+    handle_ollama_query("hello")
+
+    assert flags == [_STATE_SPEAKING]
+    assert not julie_julie_app._state & _STATE_SPEAKING
+
+def test_ollama_body_encoding():
+    """Test that the prebuilt request body is the JSON we expect."""
+    body = json.loads(_ollama_body("llama3", 'Who said "hi"?\n'))
+
+    assert body["model"] == "llama3"
+    assert body["stream"] is True
+    assert body["prompt"].startswith("You are Julie Julie")
+    assert body["prompt"].endswith('Question: Who said "hi"?\n')
+
+def test_ollama_frame_extraction():
+    """Test pulling the token and done flag out of stream frames."""
+    assert _ollama_frame(b'{"model":"llama3","response":"Hi there","done":false}') == ("Hi there", False)
+    assert _ollama_frame(b'{"model":"llama3","response":"Say \\"hi\\"","done":false}') == ('Say "hi"', False)
+    assert _ollama_frame(b'{"model":"llama3","response":"","done":true,"context":[1,2]}') == ("", True)
+    assert _ollama_frame(b'not json') is None
+
+def test_ollama_frame_rejects_malformed_frames():
+    """Test that truncated or garbled frames are not spoken."""
+    assert _ollama_frame(b'{"model":"x","response":"Hi"') is None
+    assert _ollama_frame(b'garbage "response":"oops" more') is None
+
+# Speech queue
+
+@patch('julie_julie_app.speak_text')
+def test_utterances_queued_while_speaking_are_coalesced(mock_speak_text):
+    """Test that utterances waiting behind a busy speaker are spoken in one call."""
+    started, release = threading.Event(), threading.Event()
+    mock_speak_text.side_effect = lambda text: (started.set(), release.wait(5))
+
+    speak("First.")
+    assert started.wait(5)  # the first utterance starts at once, without waiting for more
+    speak("Second.")
+    speak("Third.")
+    release.set()
+    SPEECH_Q.join()
+
+    assert [call.args[0] for call in mock_speak_text.call_args_list] == ["First.", "Second. Third."]
+
+# Command processing
+
+def test_time_command_processing(fast_mocks):
+    """Test that time commands are processed correctly."""
+    result = process_command_from_user("what time is it")
+
+    assert result is not None
+    assert "spoken_response" in result
+    assert "time" in result["spoken_response"].lower()
+
+    SPEECH_Q.join()  # Speech runs on a background thread
+    # Verify that the 'say' command was called
+    fast_mocks.sub.assert_called()
+
+def test_calculation_command_processing(fast_mocks):
+    """Test calculation command through the full processing logic."""
+    result = process_command_from_user("47 + 23")
+
+    assert result is not None
+    assert "70" in result["spoken_response"]
+    SPEECH_Q.join()
+    fast_mocks.sub.assert_called()
+
+def test_spotify_command_processing(fast_mocks):
+    """Test Spotify command through the full processing logic."""
+    result = process_command_from_user("spotify play hello")
+
+    assert result is not None
+    assert "spoken_response" in result
+
+    # Should have opened browser and triggered speech
+    SPEECH_Q.join()
+    fast_mocks.browser.assert_called()
+    fast_mocks.sub.assert_called()
+
+def test_time_words_must_be_whole_words(mock_ollama):
+    """Test that 'time' inside another word does not trigger the time handler."""
+    mock_ollama.return_value = {"spoken_response": "Maybe.", "opened_url": None, "additional_context": None}
+
+    result = process_command_from_user("sometimes I wonder about things")
+
+    assert result["spoken_response"] == "Maybe."
+    mock_ollama.assert_called_once()
+
+def test_service_prefix_routes_directly(fast_mocks):
+    """Test that a leading service name wins over keyword handlers."""
+    result = process_command_from_user("spotify play time after time")
+
+    assert "Searching for" in result["spoken_response"]
+    fast_mocks.browser.assert_called_once()
+
+@pytest.mark.no_cover  # two-line guard; not worth line tracing
+def test_empty_command():
+    """Test handling of empty commands."""
+    result = process_command_from_user("")
+
+    assert result is not None
+    assert "didn't receive" in result["spoken_response"]
+
+@pytest.mark.no_cover
+def test_none_command():
+    """Test handling of None commands."""
+    result = process_command_from_user(None)
+
+    assert result is not None
+    assert "didn't receive" in result["spoken_response"]
+
+def test_fallback_to_ollama(mock_ollama):
+    """Test that unrecognized commands fall back to Ollama."""
+    result = process_command_from_user("tell me a random fact")
+
+    assert result["spoken_response"] == "stub"
+    mock_ollama.assert_called_once_with("tell me a random fact")
@@ -1,99 +1,184 @@
 # tests/test_flask_api.py
-import unittest
 from unittest.mock import patch, MagicMock
-import json
-import sys
-import os
-
-# Add the parent directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from julie_julie_app import flask_app
-
-class TestFlaskAPI(unittest.TestCase):
-    """Test the Flask API endpoints."""
-    
-    def setUp(self):
-        """Set up test client."""
-        self.app = flask_app.test_client()
-        self.app.testing = True
-    
-    def test_home_endpoint(self):
-        """Test the home endpoint returns status information."""
-        response = self.app.get('/')
-        
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.data)
-        self.assertIn("status", data)
-        self.assertIn("app", data)
-        self.assertIn("version", data)
-        self.assertEqual(data["status"], "online")
-        self.assertEqual(data["app"], "Julie Julie")
-    
-    @patch('julie_julie_app.process_command_from_user')
-    def test_command_endpoint_with_json(self, mock_process):
-        """Test the command endpoint with JSON data."""
-        mock_process.return_value = {
-            "spoken_response": "Test response",
-            "opened_url": None,
-            "additional_context": None
-        }
-        
-        response = self.app.post('/command',
-                                json={"text_command": "what time is it"},
-                                content_type='application/json')
-        
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.data)
-        self.assertEqual(data["status"], "success")
-        self.assertIn("details", data)
-        
-        mock_process.assert_called_once_with("what time is it")
-    
-    @patch('julie_julie_app.process_command_from_user')
-    def test_command_endpoint_with_form_data(self, mock_process):
-        """Test the command endpoint with form data."""
-        mock_process.return_value = {
-            "spoken_response": "Test response",
-            "opened_url": None,
-            "additional_context": None
-        }
-        
-        response = self.app.post('/command',
-                                data={"text_command": "what time is it"})
-        
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.data)
-        self.assertEqual(data["status"], "success")
-        
-        mock_process.assert_called_once_with("what time is it")
-    
-    def test_command_endpoint_without_command(self):
-        """Test the command endpoint without a text_command parameter."""
-        response = self.app.post('/command', json={})
-        
-        self.assertEqual(response.status_code, 400)
-        
-        data = json.loads(response.data)
-        self.assertEqual(data["status"], "error")
-        self.assertIn("No text_command provided", data["message"])
-    
-    @patch('julie_julie_app.process_command_from_user')
-    def test_command_endpoint_with_exception(self, mock_process):
-        """Test the command endpoint when processing raises an exception."""
-        mock_process.side_effect = Exception("Test error")
-        
-        response = self.app.post('/command',
-                                json={"text_command": "test command"})
-        
-        self.assertEqual(response.status_code, 500)
-        
-        data = json.loads(response.data)
-        self.assertEqual(data["status"], "error")
-        self.assertIn("Test error", data["message"])
-
-if __name__ == '__main__':
-    unittest.main()
+import logging
+import time
+import pytest
+
+from julie_julie_app import logger, _JOBS, JOB_TTL, SPEECH_Q, _set_state, _STATE_PROCESSING
+from tests.conftest import run_command, wait_for_task
+
+def test_home_endpoint(client):
+    """Test the home endpoint returns status information."""
+    response = client.get('/')
+
+    assert response.status_code == 200
+
+    data = response.get_json()
+    assert "status" in data
+    assert "app" in data
+    assert "version" in data
+    assert data["status"] == "online"
+    assert data["app"] == "Julie Julie"
+
+def test_status_endpoint(client):
+    """Test that /status reports an idle assistant as ready."""
+    SPEECH_Q.join()
+    response = client.get('/status')
+
+    assert response.status_code == 200
+
+    data = response.get_json()
+    assert data["state"] == 0
+    assert not data["is_speaking"]
+    assert not data["is_processing"]
+    assert data["ready_for_command"]
+
+def test_status_stays_busy_until_last_command_finishes(client):
+    """Test that one of two overlapping commands finishing does not report ready."""
+    _set_state(_STATE_PROCESSING, True)
+    _set_state(_STATE_PROCESSING, True)
+    try:
+        _set_state(_STATE_PROCESSING, False)
+        data = client.get('/status').get_json()
+        assert data["is_processing"]
+        assert not data["ready_for_command"]
+    finally:
+        _set_state(_STATE_PROCESSING, False)
+
+    assert client.get('/status').get_json()["ready_for_command"]
+
+def test_status_counts_queued_speech(client):
+    """Test that a reply waiting for the speech thread is reported as speaking."""
+    SPEECH_Q.join()
+    SPEECH_Q.put("queued")  # unfinished task, as if speak() had just been called
+    try:
+        data = client.get('/status').get_json()
+        assert data["is_speaking"]
+        assert not data["ready_for_command"]
+    finally:
+        SPEECH_Q.join()
+
+@patch('julie_julie_app.process_command_from_user')
+def test_command_endpoint_with_json(mock_process, client):
+    """Test the command endpoint with JSON data."""
+    mock_process.return_value = {
+        "spoken_response": "Test response",
+        "opened_url": None,
+        "additional_context": None
+    }
+
+    response = client.post('/command',
+                            json={"text_command": "what time is it"},
+                            content_type='application/json')
+
+    assert response.status_code == 202
+
+    data = response.get_json()
+    assert data["status"] == "accepted"
+
+    response = wait_for_task(client, data["task_id"])
+    assert response.status_code == 200
+
+    data = response.get_json()
+    assert data["status"] == "success"
+    assert "details" in data
+
+    mock_process.assert_called_once_with("what time is it")
+
+@patch('julie_julie_app.process_command_from_user')
+def test_command_endpoint_with_form_data(mock_process, client):
+    """Test the command endpoint with form data."""
+    mock_process.return_value = {
+        "spoken_response": "Test response",
+        "opened_url": None,
+        "additional_context": None
+    }
+
+    response = run_command(client, data={"text_command": "what time is it"})
+    assert response.status_code == 200
+
+    data = response.get_json()
+    assert data["status"] == "success"
+
+    mock_process.assert_called_once_with("what time is it")
+
+def test_command_endpoint_without_command(client):
+    """Test the command endpoint without a text_command parameter."""
+    response = client.post('/command', json={})
+
+    assert response.status_code == 400
+
+    data = response.get_json()
+    assert data["status"] == "error"
+    assert "No text_command provided" in data["message"]
+
+@patch('julie_julie_app.process_command_from_user')
+def test_command_endpoint_with_exception(mock_process, client, caplog):
+    """Test the command endpoint when processing raises an exception."""
+    mock_process.side_effect = RuntimeError("Test error")
+    # The failure is expected; skip formatting and writing its log record
+    caplog.set_level(logging.CRITICAL, logger=logger.name)
+
+    response = run_command(client, json={"text_command": "test command"})
+    assert response.status_code == 500
+
+    data = response.get_json()
+    assert data["status"] == "error"
+    assert "Test error" in data["message"]
+
+@patch('julie_julie_app.process_command_from_user')
+def test_activate_listening_is_asynchronous(mock_process, client):
+    """Test that activate_listening queues the command and returns 202."""
+    mock_process.return_value = {
+        "spoken_response": "Test response",
+        "opened_url": None,
+        "additional_context": None
+    }
+
+    response = client.post('/activate_listening',
+                            data={"text_command": "what time is it"})
+
+    assert response.status_code == 202
+
+    data = response.get_json()
+    assert data["status"] == "accepted"
+    assert "job_id" in data
+
+    # Wait for the worker, then fetch the result
+    _JOBS[data["job_id"]].result(timeout=5)
+    response = client.get(f'/result/{data["job_id"]}')
+
+    assert response.status_code == 200
+    result = response.get_json()
+    assert result["details"]["spoken_response"] == "Test response"
+    mock_process.assert_called_once_with("what time is it")
+
+def test_result_unknown_job(client):
+    """Test that an unknown job id returns 404."""
+    response = client.get('/result/does-not-exist')
+
+    assert response.status_code == 404
+
+    response = client.get('/command/does-not-exist')
+
+    assert response.status_code == 404
+
+@patch('julie_julie_app.process_command_from_user')
+def test_unfetched_jobs_expire(mock_process, client):
+    """Test that finished jobs nobody fetched are dropped after JOB_TTL."""
+    mock_process.return_value = {"spoken_response": "ok", "opened_url": None, "additional_context": None}
+
+    stale = client.post('/command', data={"text_command": "first"}).get_json()["task_id"]
+    _JOBS[stale].result(timeout=5)
+    deadline = time.monotonic() + 5
+    while not hasattr(_JOBS[stale], "finished_at"):  # done-callbacks run just after result()
+        if time.monotonic() > deadline:
+            pytest.fail("Job finished without running its done-callback")
+        time.sleep(0.001)
+    _JOBS[stale].finished_at -= JOB_TTL + 1  # as if it finished long ago
+
+    fresh = client.post('/command', data={"text_command": "second"}).get_json()["task_id"]
+
+    assert stale not in _JOBS
+    assert client.get(f'/command/{stale}').status_code == 404
+    assert wait_for_task(client, fresh).status_code == 200
@@ -0,0 +1,30 @@
+# tests/test_output_utils.py
+import sys
+
+from utils.output_utils import capture_stdout, suppress_stdout
+
+def test_capture_stdout_collects_prints():
+    """Test that printed text is captured and kept off the real stdout."""
+    original = sys.stdout
+    with capture_stdout() as captured:
+        print("hello")
+        assert sys.stdout is captured
+
+    assert sys.stdout is original
+    assert captured.getvalue() == "hello\n"
+
+def test_capture_stdout_max_chars():
+    """Test that max_chars keeps only the start of the output."""
+    with capture_stdout(max_chars=4) as captured:
+        print("abcdef")
+        print("more")
+
+    assert captured.getvalue() == "abcd"
+
+def test_suppress_stdout_drops_prints(capsys):
+    """Test that printed text is discarded and stdout is restored afterwards."""
+    with suppress_stdout():
+        print("hidden")
+    print("shown")
+
+    assert capsys.readouterr().out == "shown\n"
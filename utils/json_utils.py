@@ -0,0 +1,32 @@
+"""
+JSON helpers for Julie Julie.
+Uses orjson when it is installed and falls back to the standard library json module.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+def loads(data):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj) -> str:
+    """Serialize obj to a compact JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+def dumpb(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, skipping the str round trip."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
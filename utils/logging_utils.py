@@ -3,7 +3,11 @@ Custom logging formatter and handlers for Julie Julie using Rich.
 Provides beautiful, properly wrapped output with colors and formatting.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import TextIO
 from rich.console import Console
@@ -14,12 +18,31 @@ from rich.align import Align
 from rich import box
 from datetime import datetime
 
-# Global Rich console
-console = Console()
+# Global Rich console; messages carry explicit markup, so skip auto-highlighting
+console = Console(highlight=False)
 
 class JulieJulieRichHandler(RichHandler):
     """Custom Rich handler for Julie Julie with special formatting for different message types."""
     
+    # Panel settings are fixed, so build them once rather than per record
+    _AI_PANEL = dict(
+        title="🎤 AI Response",
+        title_align="left",
+        border_style="green",
+        box=box.ROUNDED,
+        padding=(0, 1)
+    )
+    _COMMAND_PANEL = dict(
+        title="📝 User Command",
+        title_align="left",
+        border_style="blue",
+        box=box.SIMPLE,
+        padding=(0, 1)
+    )
+    
+    _SPEECH_PREFIXES = ("Speaking sentence:", "Speaking final fragment:")
+    _COMMAND_PREFIX = "Processing command:"
+    
     def __init__(self):
         super().__init__(
             console=console,
@@ -30,41 +53,33 @@ class JulieJulieRichHandler(RichHandler):
             tracebacks_show_locals=False
         )
     
+    @staticmethod
+    def _payload(record):
+        """Text after the prefix: the lone %s argument, or the formatted tail."""
+        if len(record.args or ()) == 1 and record.msg.endswith(": %s"):
+            return str(record.args[0])
+        head, sep, tail = record.getMessage().partition(": ")
+        return tail if sep else head
+    
     def emit(self, record):
         """Custom emit method with special handling for different message types."""
-        message = record.getMessage()
+        # Match on the raw template; ordinary records are formatted once, by RichHandler
+        raw = record.msg if isinstance(record.msg, str) else ""
         
         # Handle AI speech specially
-        if "Speaking sentence:" in message or "Speaking final fragment:" in message:
-            speech_text = message.split(": ", 1)[1] if ": " in message else message
+        if raw.startswith(self._SPEECH_PREFIXES):
+            speech_text = self._payload(record)
             
-            # Create a beautiful panel for AI speech
-            ai_panel = Panel(
-                Text(speech_text, style="bright_green"),
-                title="🎤 AI Response",
-                title_align="left",
-                border_style="green",
-                box=box.ROUNDED,
-                padding=(0, 1)
-            )
-            
-            console.print()
-            console.print(ai_panel)
-            console.print()
+            # Create a beautiful panel for AI speech, framed by blank lines
+            ai_panel = Panel(Text(speech_text, style="bright_green"), **self._AI_PANEL)
+            console.print("", ai_panel, "", sep="\n")
             return
         
         # Handle user commands specially
-        elif "Processing command:" in message:
-            command_text = message.split(": ", 1)[1] if ": " in message else message
+        elif raw.startswith(self._COMMAND_PREFIX):
+            command_text = self._payload(record)
             
-            command_panel = Panel(
-                Text(command_text, style="bright_blue bold"),
-                title="📝 User Command",
-                title_align="left",
-                border_style="blue",
-                box=box.SIMPLE,
-                padding=(0, 1)
-            )
+            command_panel = Panel(Text(command_text, style="bright_blue bold"), **self._COMMAND_PANEL)
             
             console.print(command_panel)
             return
@@ -72,6 +87,16 @@ class JulieJulieRichHandler(RichHandler):
         # For all other messages, use the standard Rich handler
         super().emit(record)
 
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a listener in the same process.
+    Records are queued as-is instead of being pre-formatted on the caller's
+    thread, so formatting runs on the listener and exc_info reaches Rich.
+    """
+    
+    def prepare(self, record):
+        return record
+
 def setup_rich_logging(app_name: str, log_file: str, debug: bool = False) -> logging.Logger:
     """Set up Rich logging for Julie Julie."""
     
@@ -79,61 +104,78 @@ def setup_rich_logging(app_name: str, log_file: str, debug: bool = False) -> log
     logger = logging.getLogger(app_name.lower().replace(' ', '_'))
     logger.setLevel(logging.DEBUG if debug else logging.INFO)
     
-    # Remove existing handlers
+    # Remove existing handlers, stopping the listener from an earlier setup
+    old_listener = getattr(logger, "_listener", None)
+    if old_listener is not None:
+        atexit.unregister(old_listener.stop)
+        old_listener.stop()
+        for handler in old_listener.handlers:
+            handler.close()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
-    # Console handler with Rich
-    console_handler = JulieJulieRichHandler()
+    # Console handler with Rich on a terminal; plain lines when output is piped
+    if sys.stdout is not None and sys.stdout.isatty():
+        console_handler = JulieJulieRichHandler()
+    else:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
     console_handler.setLevel(logging.INFO)
     
     # File handler without Rich (plain text)
     import os
     log_dir = os.path.dirname(log_file)
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
     
-    file_handler = logging.FileHandler(log_file)
+    # delay=True opens the file on the first record rather than at setup
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     ))
     
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Route records through a queue so callers only enqueue; the listener
+    # thread does the formatting, console rendering and file writes
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    logger._listener = listener  # Lets a later setup stop it
+    
+    logger.addHandler(_LocalQueueHandler(log_queue))
     
     # Prevent propagation to avoid duplicate messages
     logger.propagate = False
     
     return logger
 
-def print_startup_banner(app_name: str, version: str):
-    """Print a beautiful startup banner."""
-    title_text = Text(f"{app_name} v{version}", style="bold magenta")
-    subtitle_text = Text("Voice Assistant Ready", style="dim cyan")
-    
-    banner = Panel(
+@functools.lru_cache(maxsize=8)
+def _banner(app_name: str, version: str) -> Panel:
+    """Build the startup banner panel once per app name and version."""
+    return Panel(
         Align.center(f"[bold magenta]{app_name} v{version}[/]\n[dim cyan]Voice Assistant Ready[/]"),
         title="🚀 Starting",
         border_style="magenta",
         box=box.DOUBLE
     )
-    
-    console.print()
-    console.print(banner)
-    console.print()
+
+def print_startup_banner(app_name: str, version: str):
+    """Print a beautiful startup banner."""
+    console.print("", _banner(app_name, version), "", sep="\n")
+
+_STYLES = {
+    "info": ("ℹ️", "cyan"),
+    "success": ("✅", "green"),
+    "warning": ("⚠️", "yellow"),
+    "error": ("❌", "red")
+}
 
 def print_status_message(message: str, status_type: str = "info"):
     """Print a status message with appropriate styling."""
-    styles = {
-        "info": ("ℹ️", "cyan"),
-        "success": ("✅", "green"),
-        "warning": ("⚠️", "yellow"),
-        "error": ("❌", "red")
-    }
-    
-    icon, color = styles.get(status_type, ("ℹ️", "cyan"))
+    icon, color = _STYLES.get(status_type, _STYLES["info"])
     console.print(f"[{color}]{icon} {message}[/]")
 
 def print_ai_thinking():
@@ -147,11 +189,11 @@ def setup_colored_logging(app_name: str, log_file: str, debug: bool = False) ->
 
 def log_ai_response(text: str, logger: logging.Logger):
     """Log AI response with special formatting."""
-    logger.info(f"Speaking sentence: {text}")
+    logger.info("Speaking sentence: %s", text)
 
 def log_user_command(command: str, logger: logging.Logger):
     """Log user command with special formatting."""
-    logger.info(f"Processing command: {command}")
+    logger.info("Processing command: %s", command)
 
 def log_success(message: str, logger: logging.Logger):
     """Log success message with special formatting."""
@@ -2,26 +2,39 @@
 Utility for capturing stdout to prevent unwanted text output.
 """
 
-import sys
 import io
-from contextlib import contextmanager
+import os
+from contextlib import contextmanager, redirect_stdout
 
-@contextmanager
-def capture_stdout():
-    """Context manager to capture and suppress stdout."""
-    old_stdout = sys.stdout
-    sys.stdout = captured_output = io.StringIO()
-    try:
-        yield captured_output
-    finally:
-        sys.stdout = old_stdout
+class _BoundedStringIO(io.StringIO):
+    """StringIO that keeps the first max_chars characters and drops the rest."""
+
+    def __init__(self, max_chars):
+        super().__init__()
+        self._room = max_chars
+
+    def write(self, s):
+        if self._room > 0:
+            kept = s[:self._room]
+            self._room -= len(kept)
+            super().write(kept)
+        return len(s)
+
+def capture_stdout(max_chars=None):
+    """
+    Context manager to capture and suppress stdout.
+    Only Python-level writes are captured; pass max_chars to cap how much is kept.
+    """
+    buffer = io.StringIO() if max_chars is None else _BoundedStringIO(max_chars)
+    return redirect_stdout(buffer)
 
 @contextmanager
 def suppress_stdout():
-    """Context manager to completely suppress stdout."""
-    old_stdout = sys.stdout
-    sys.stdout = io.StringIO()
-    try:
+    """
+    Context manager to completely suppress stdout.
+    sys.stdout is swapped for the null device, so Python-level writes from
+    every thread are dropped while it is active; output written straight to
+    file descriptor 1 by C code or child processes is not affected.
+    """
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
         yield
-    finally:
-        sys.stdout = old_stdout